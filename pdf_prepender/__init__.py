@@ -1,31 +1,35 @@
 """PDF Prepender - A library for prepending dynamically generated pages to PDFs."""
 
-from pdf_prepender.core.document_builder import DocumentBuilder, prepend_pages
-from pdf_prepender.core.link_manager import LinkManager
-from pdf_prepender.core.page_generator import PageGenerator
-from pdf_prepender.core.pdf_merger import PdfMerger, count_pdf_pages
-from pdf_prepender.models.schema import (
-    Alignment,
-    BulletPoint,
-    ContentElement,
-    Defaults,
-    IndentedBulletPoint,
-    LinkableItem,
-    OverflowBehavior,
-    Page,
-    PageHeading,
-    PageSize,
-    PrependSpecification,
-    SectionHeading,
-    SectionSubheading,
-)
-from pdf_prepender.parsers.json_parser import (
-    JsonParseError,
-    parse_json_dict,
-    parse_json_file,
-    parse_json_string,
-)
-from pdf_prepender.parsers.text_formatter import TextFormatter
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pdf_prepender.core.document_builder import DocumentBuilder, prepend_pages
+    from pdf_prepender.core.link_manager import LinkManager
+    from pdf_prepender.core.page_generator import PageGenerator
+    from pdf_prepender.core.pdf_merger import PdfMerger, count_pdf_pages
+    from pdf_prepender.models.schema import (
+        Alignment,
+        BulletPoint,
+        ContentElement,
+        Defaults,
+        IndentedBulletPoint,
+        LinkableItem,
+        OverflowBehavior,
+        Page,
+        PageHeading,
+        PageSize,
+        PrependSpecification,
+        SectionHeading,
+        SectionSubheading,
+    )
+    from pdf_prepender.parsers.json_parser import (
+        JsonParseError,
+        parse_json_dict,
+        parse_json_file,
+        parse_json_string,
+    )
+    from pdf_prepender.parsers.text_formatter import TextFormatter
 
 __version__ = "0.1.0"
 
@@ -59,3 +63,46 @@ __all__ = [
     "JsonParseError",
     "TextFormatter",
 ]
+
+# Public names are imported on first access (PEP 562), so importing the
+# package does not load ReportLab, pypdf or PyMuPDF until they are needed
+_LAZY_IMPORTS = {
+    "DocumentBuilder": "pdf_prepender.core.document_builder",
+    "prepend_pages": "pdf_prepender.core.document_builder",
+    "PageGenerator": "pdf_prepender.core.page_generator",
+    "PdfMerger": "pdf_prepender.core.pdf_merger",
+    "LinkManager": "pdf_prepender.core.link_manager",
+    "count_pdf_pages": "pdf_prepender.core.pdf_merger",
+    "PrependSpecification": "pdf_prepender.models.schema",
+    "Page": "pdf_prepender.models.schema",
+    "PageHeading": "pdf_prepender.models.schema",
+    "ContentElement": "pdf_prepender.models.schema",
+    "SectionHeading": "pdf_prepender.models.schema",
+    "SectionSubheading": "pdf_prepender.models.schema",
+    "BulletPoint": "pdf_prepender.models.schema",
+    "IndentedBulletPoint": "pdf_prepender.models.schema",
+    "LinkableItem": "pdf_prepender.models.schema",
+    "Defaults": "pdf_prepender.models.schema",
+    "Alignment": "pdf_prepender.models.schema",
+    "OverflowBehavior": "pdf_prepender.models.schema",
+    "PageSize": "pdf_prepender.models.schema",
+    "parse_json_file": "pdf_prepender.parsers.json_parser",
+    "parse_json_string": "pdf_prepender.parsers.json_parser",
+    "parse_json_dict": "pdf_prepender.parsers.json_parser",
+    "JsonParseError": "pdf_prepender.parsers.json_parser",
+    "TextFormatter": "pdf_prepender.parsers.text_formatter",
+}
+
+
+def __getattr__(name: str):
+    """Import a public name on first access and cache it on the module."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,18 @@
 """Core components for PDF generation and merging."""
 
-from pdf_prepender.core.document_builder import DocumentBuilder, prepend_pages
-from pdf_prepender.core.link_annotator import LinkAnnotator, add_links_to_pdf
-from pdf_prepender.core.link_manager import LinkInfo, LinkManager
-from pdf_prepender.core.page_generator import PageGenerator
-from pdf_prepender.core.pdf_merger import PdfMerger, count_pdf_pages
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pdf_prepender.core.document_builder import DocumentBuilder, prepend_pages
+    from pdf_prepender.core.link_annotator import LinkAnnotator, add_links_to_pdf
+    from pdf_prepender.core.link_manager import LinkInfo, LinkManager
+    from pdf_prepender.core.page_generator import PageGenerator
+    from pdf_prepender.core.pdf_merger import (
+        PdfMerger,
+        count_pdf_pages,
+        open_pdf_reader,
+    )
 
 __all__ = [
     "DocumentBuilder",
@@ -12,8 +20,38 @@ __all__ = [
     "PageGenerator",
     "PdfMerger",
     "count_pdf_pages",
+    "open_pdf_reader",
     "LinkManager",
     "LinkInfo",
     "LinkAnnotator",
     "add_links_to_pdf",
 ]
+
+# Imported on first access so that loading one submodule does not pull in
+# the backends of all the others
+_LAZY_IMPORTS = {
+    "DocumentBuilder": "pdf_prepender.core.document_builder",
+    "prepend_pages": "pdf_prepender.core.document_builder",
+    "PageGenerator": "pdf_prepender.core.page_generator",
+    "PdfMerger": "pdf_prepender.core.pdf_merger",
+    "count_pdf_pages": "pdf_prepender.core.pdf_merger",
+    "open_pdf_reader": "pdf_prepender.core.pdf_merger",
+    "LinkManager": "pdf_prepender.core.link_manager",
+    "LinkInfo": "pdf_prepender.core.link_manager",
+    "LinkAnnotator": "pdf_prepender.core.link_annotator",
+    "add_links_to_pdf": "pdf_prepender.core.link_annotator",
+}
+
+
+def __getattr__(name: str):
+    """Import a public name on first access and cache it on the module."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
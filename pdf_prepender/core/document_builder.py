@@ -1,12 +1,10 @@
 """Document builder that orchestrates PDF generation and merging."""
 
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Iterable
 
-from pdf_prepender.core.link_annotator import LinkAnnotator
 from pdf_prepender.core.link_manager import LinkManager
-from pdf_prepender.core.page_generator import PageGenerator
-from pdf_prepender.core.pdf_merger import PdfMerger, count_pdf_pages
+from pdf_prepender.core.page_generator import LinkPosition, PageGenerator
 from pdf_prepender.models.schema import PrependSpecification
 from pdf_prepender.parsers.json_parser import (
     parse_json_dict,
@@ -19,11 +17,11 @@ class DocumentBuilder:
     """
     Main orchestrator for prepending pages to PDFs.
 
-    Implements the two-pass algorithm:
-    1. First pass: Generate prepended content to count pages
-    2. Calculate offset for link targets
-    3. Second pass: Regenerate with adjusted link targets
-    4. Merge and create named destinations with link annotations
+    Implements a single-pass algorithm:
+    1. Generate prepended content once, recording links by original page
+    2. Calculate offset for link targets from the generated page count
+    3. Merge and create named destinations
+    4. Add link annotations, applying the offset to their targets
     """
 
     def __init__(self, spec: PrependSpecification):
@@ -36,6 +34,17 @@ class DocumentBuilder:
         self.spec = spec
         self.link_manager = LinkManager()
 
+    @property
+    def spec(self) -> PrependSpecification:
+        """The prepend specification."""
+        return self._spec
+
+    @spec.setter
+    def spec(self, spec: PrependSpecification) -> None:
+        # The cached page count belongs to the previous specification
+        self._spec = spec
+        self._cached_page_count: int | None = None
+
     @classmethod
     def from_json_file(cls, json_path: str | Path) -> "DocumentBuilder":
         """
@@ -65,67 +74,152 @@ class DocumentBuilder:
         return cls(spec)
 
     @classmethod
-    def from_dict(cls, data: dict) -> "DocumentBuilder":
+    def from_dict(cls, data: dict | PrependSpecification) -> "DocumentBuilder":
         """
         Create a DocumentBuilder from a dictionary.
 
         Args:
-            data: Dictionary containing the specification
+            data: Dictionary containing the specification, or an already
+                validated PrependSpecification to reuse as-is
 
         Returns:
             DocumentBuilder instance
         """
-        spec = parse_json_dict(data)
-        return cls(spec)
+        if isinstance(data, PrependSpecification):
+            return cls(data)
+        return cls(parse_json_dict(data))
 
     def build(
         self,
-        original_pdf: str | Path | BinaryIO | bytes,
+        original_pdf: str | Path | BinaryIO | bytes | bytearray | memoryview,
         output: str | Path | BinaryIO | None = None,
     ) -> bytes | None:
         """
         Build the final PDF with prepended pages.
 
-        This implements a two-pass algorithm:
-        1. First pass: Generate prepended pages to count pages
+        Link text does not depend on where its target ends up, so the
+        prepended pages are generated once with links recorded against
+        original page numbers, and the targets are shifted afterwards:
+        1. Generate prepended pages and link positions
         2. Set link offsets based on page count
-        3. Second pass: Regenerate with correct link targets, merge PDFs
-        4. Add link annotations using PyMuPDF
+        3. Merge PDFs and create named destinations using PyMuPDF
+        4. Add link annotations to the same document, shifting their targets
 
         Args:
-            original_pdf: The original PDF to prepend to
+            original_pdf: The original PDF to prepend to. In-memory PDFs
+                (bytes, bytearray or memoryview) are read in place
+                without being copied.
             output: Optional output path or stream. If None, returns bytes.
 
         Returns:
             PDF bytes if output is None, otherwise None
         """
-        # First pass: Generate to count pages
-        generator = PageGenerator(self.spec, self.link_manager)
-        _, prepend_page_count, _ = generator.generate()
+        if not self.spec.pages:
+            # Nothing to prepend; the output is the original unchanged
+            self._record_page_count(0)
+            return self._copy(original_pdf, output)
+
+        prepend_bytes, link_positions = self._generate()
+        return self._merge(prepend_bytes, link_positions, original_pdf, output)
 
-        # Set the offset in link manager
-        self.link_manager.set_prepended_page_count(prepend_page_count)
+    def build_many(
+        self,
+        originals: Iterable[str | Path | BinaryIO | bytes],
+        outputs: Iterable[str | Path | BinaryIO | None] | None = None,
+    ) -> list[bytes | None]:
+        """
+        Prepend the same pages to several PDFs.
 
-        # Second pass: Regenerate with adjusted links and merge
-        generator = PageGenerator(self.spec, self.link_manager)
-        prepend_bytes, _, link_positions = generator.generate()
+        The prepended pages and their link positions are generated once and
+        merged into every original, so only the merge is repeated.
 
-        # Merge with original PDF (without link annotations)
-        merger = PdfMerger()
-        merged_bytes = merger.merge_with_destinations(
-            prepend_bytes=prepend_bytes,
-            original_pdf=original_pdf,
-            output=None,  # Get bytes back for link annotation
-        )
+        Args:
+            originals: The original PDFs to prepend to
+            outputs: Optional output path or stream for each original. If
+                None, bytes are returned for every original.
+
+        Returns:
+            For each original, PDF bytes if its output is None, otherwise None
+
+        Raises:
+            ValueError: If outputs and originals differ in length
+        """
+        originals = list(originals)
+        outputs = [None] * len(originals) if outputs is None else list(outputs)
+        if len(outputs) != len(originals):
+            raise ValueError(
+                f"Got {len(outputs)} outputs for {len(originals)} originals"
+            )
+
+        if not self.spec.pages:
+            self._record_page_count(0)
+            return [
+                self._copy(original_pdf, output)
+                for original_pdf, output in zip(originals, outputs)
+            ]
+
+        prepend_bytes, link_positions = self._generate()
+        return [
+            self._merge(prepend_bytes, link_positions, original_pdf, output)
+            for original_pdf, output in zip(originals, outputs)
+        ]
+
+    def _generate(self) -> tuple[bytes, list[LinkPosition]]:
+        """
+        Generate the prepended pages and set the link offset.
+
+        Links are recorded against original page numbers, since their text
+        does not depend on where the target ends up.
+
+        Returns:
+            Tuple of (prepended PDF bytes, list of link positions)
+        """
+        generator = PageGenerator(self.spec, LinkManager())
+        prepend_bytes, prepend_page_count, link_positions = generator.generate()
+        self._record_page_count(prepend_page_count)
+        return prepend_bytes, link_positions
+
+    def _record_page_count(self, page_count: int) -> None:
+        """Cache the prepended page count and set it as the link offset."""
+        self._cached_page_count = page_count
+        self.link_manager.set_prepended_page_count(page_count)
+
+    def _merge(
+        self,
+        prepend_bytes: bytes,
+        link_positions: list[LinkPosition],
+        original_pdf: str | Path | BinaryIO | bytes | bytearray | memoryview,
+        output: str | Path | BinaryIO | None,
+    ) -> bytes | None:
+        """
+        Merge the prepended pages into one original PDF.
+
+        Named destinations and link annotations are added in the same
+        PyMuPDF document; link targets are shifted by the link offset.
+        """
+        # Imported here so that building a spec, or only counting its
+        # pages, does not load PyMuPDF
+        from pdf_prepender.core.link_annotator import LinkAnnotator
 
-        # Add link annotations using PyMuPDF (second pass on merged PDF)
         annotator = LinkAnnotator()
-        return annotator.add_links(
-            pdf_bytes=merged_bytes,
+        return annotator.merge_and_add_links(
+            prepend_pdf=prepend_bytes,
+            original_pdf=original_pdf,
             link_positions=link_positions,
             output=output,
+            page_offset=self.link_manager.prepended_page_count,
         )
 
+    def _copy(
+        self,
+        original_pdf: str | Path | BinaryIO | bytes | bytearray | memoryview,
+        output: str | Path | BinaryIO | None,
+    ) -> bytes | None:
+        """Copy one original PDF to its output unchanged, without parsing it."""
+        from pdf_prepender.core.link_annotator import _copy_pdf
+
+        return _copy_pdf(original_pdf, output)
+
     def build_to_file(
         self,
         original_pdf: str | Path,
@@ -144,14 +238,16 @@ class DocumentBuilder:
         """
         Get the number of pages that will be prepended.
 
-        Useful for preview or planning purposes.
+        Useful for preview or planning purposes. The count is cached until
+        ``spec`` is replaced, so calling this before build() is cheap.
 
         Returns:
             Number of pages in the prepended section
         """
-        generator = PageGenerator(self.spec, LinkManager())
-        _, page_count, _ = generator.generate()
-        return page_count
+        if self._cached_page_count is None:
+            generator = PageGenerator(self.spec, LinkManager())
+            self._cached_page_count = generator.plan()
+        return self._cached_page_count
 
 
 def prepend_pages(
@@ -173,7 +269,11 @@ def prepend_pages(
     if isinstance(json_spec, dict):
         builder = DocumentBuilder.from_dict(json_spec)
     elif isinstance(json_spec, Path) or (
-        isinstance(json_spec, str) and Path(json_spec).exists()
+        # JSON text is recognisable by its first character; only other
+        # strings are worth a filesystem lookup
+        isinstance(json_spec, str)
+        and json_spec.lstrip()[:1] not in ("{", "[")
+        and Path(json_spec).exists()
     ):
         builder = DocumentBuilder.from_json_file(json_spec)
     else:
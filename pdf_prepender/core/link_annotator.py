@@ -1,8 +1,13 @@
-"""Link annotator using PyMuPDF for adding clickable links to PDFs."""
+"""Link annotator using PyMuPDF for merging PDFs and adding clickable links."""
 
 import io
+import os
+import shutil
+import tempfile
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO
+from typing import TYPE_CHECKING, BinaryIO, Iterable
 
 import fitz  # PyMuPDF
 
@@ -11,7 +16,7 @@ if TYPE_CHECKING:
 
 
 class LinkAnnotator:
-    """Adds clickable link annotations to PDFs using PyMuPDF."""
+    """Merges PDFs and adds clickable link annotations using PyMuPDF."""
 
     def __init__(self):
         """Initialize the link annotator."""
@@ -19,89 +24,393 @@ class LinkAnnotator:
 
     def add_links(
         self,
-        pdf_bytes: bytes,
+        pdf_bytes: bytes | BinaryIO | None,
         link_positions: list["LinkPosition"],
         output: str | Path | BinaryIO | None = None,
+        page_offset: int = 0,
+        source_path: str | Path | None = None,
     ) -> bytes | None:
         """
         Add link annotations to a PDF at specified positions.
 
-        This is the second pass of the two-pass system:
-        1. First pass: Generate and merge PDF, track link positions
-        2. Second pass (this): Add actual clickable links using PyMuPDF
+        Link targets are page numbers in the original document; the
+        number of prepended pages is applied here, through ``page_offset``.
+
+        When ``pdf_bytes`` is None and ``output`` is the ``source_path``
+        file, the links are appended to the file as an incremental update
+        instead of rewriting it. Given ``pdf_bytes`` are always written to
+        ``output`` in full, with the links added.
 
         Args:
-            pdf_bytes: The merged PDF bytes (without link annotations)
+            pdf_bytes: The merged PDF (without link annotations), as bytes or
+                a stream. May be None if ``source_path`` is given.
             link_positions: List of link positions with coordinates and targets
             output: Optional output path or stream. If None, returns bytes.
+            page_offset: Number of pages to add to every link's target page
+            source_path: Path of the file the PDF was read from
 
         Returns:
             PDF bytes if output is None, otherwise None
         """
+        # Only a PDF read from source_path can be updated where it lies;
+        # given pdf_bytes are always written out in full
+        in_place = False
+        if pdf_bytes is None:
+            if source_path is None:
+                raise ValueError("Either pdf_bytes or source_path is required")
+            in_place = isinstance(output, (str, Path)) and _is_same_file(
+                source_path, output
+            )
+            if not link_positions and in_place:
+                # No links to add and the output already is the source
+                return None
+            pdf_bytes = source_path
+
         if not link_positions:
-            # No links to add, just return/write the original
-            return self._write_output(pdf_bytes, output)
+            # No links to add, so the PDF is passed through without parsing
+            # or buffering it
+            return _copy_pdf(pdf_bytes, output)
+
+        if in_place:
+            if self._add_links_incrementally(source_path, link_positions, page_offset):
+                return None
+            if isinstance(pdf_bytes, (str, Path)):
+                # A document cannot be fully rewritten over the file it
+                # was opened from
+                pdf_bytes = Path(pdf_bytes).read_bytes()
+
+        # Open PDF with PyMuPDF, over the caller's buffer for in-memory input
+        doc = _open_document(pdf_bytes)
+
+        try:
+            self._add_links(doc, link_positions, page_offset)
+            return _save_document(doc, output)
+        finally:
+            doc.close()
+
+    def _add_links_incrementally(
+        self,
+        path: str | Path,
+        link_positions: list["LinkPosition"],
+        page_offset: int,
+    ) -> bool:
+        """
+        Append link annotations to a PDF file as an incremental update.
+
+        Returns:
+            True if the file was updated, False if it does not support
+            incremental updates (e.g. it needed repair on opening)
+        """
+        doc = fitz.open(str(path), filetype="pdf")
+
+        try:
+            if not doc.can_save_incrementally():
+                return False
+            self._add_links(doc, link_positions, page_offset)
+            doc.save(str(path), incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+        finally:
+            doc.close()
+
+        return True
+
+    def merge_and_add_links(
+        self,
+        prepend_pdf: str | Path | BinaryIO | bytes,
+        original_pdf: str | Path | BinaryIO | bytes | bytearray | memoryview,
+        link_positions: list["LinkPosition"],
+        output: str | Path | BinaryIO | None = None,
+        page_offset: int = 0,
+        create_destinations: bool = True,
+    ) -> bytes | None:
+        """
+        Merge prepended pages with the original PDF and add link annotations.
+
+        Pages, named destinations, and links all go into one PyMuPDF
+        document, so the merged PDF is serialized exactly once. When both
+        the original and the output are paths and there are no links to
+        add, the original is copied to the output at the filesystem level
+        and the prepended pages are appended to that copy as an incremental
+        update, so its content is never rewritten. The output then keeps
+        the original's revision, followed by the prepended one.
+
+        Args:
+            prepend_pdf: The prepended PDF (already generated), as bytes, a
+                stream, or a path
+            original_pdf: Original PDF to append to
+            link_positions: List of link positions with coordinates and targets
+            output: Optional output path or stream. If None, returns bytes.
+            page_offset: Number of pages to add to every link's target page
+            create_destinations: Whether to create named destinations for all pages
 
-        # Open PDF with PyMuPDF
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        Returns:
+            PDF bytes if output is None, otherwise None
+        """
+        if (
+            not link_positions
+            and isinstance(original_pdf, (str, Path))
+            and isinstance(output, (str, Path))
+        ):
+            if self._merge_incrementally(
+                prepend_pdf, original_pdf, output, create_destinations
+            ):
+                return None
+
+        doc = _open_document(prepend_pdf)
 
         try:
-            # Add link annotations for each position
-            for link_pos in link_positions:
-                self._add_link(doc, link_pos)
+            original = _open_document(original_pdf)
+            try:
+                doc.insert_pdf(original)
+            finally:
+                original.close()
+
+            self._add_destinations_and_links(
+                doc, link_positions, page_offset, create_destinations
+            )
+            return _save_document(doc, output)
+        finally:
+            doc.close()
+
+    def _merge_incrementally(
+        self,
+        prepend_pdf: str | Path | BinaryIO | bytes,
+        original_path: str | Path,
+        output_path: str | Path,
+        create_destinations: bool = True,
+    ) -> bool:
+        """
+        Merge into a copy of the original file using an incremental update.
 
-            # Get the result
-            result_bytes = doc.tobytes()
+        The original is copied next to the output (the kernel does the copy
+        where the platform supports it), then only the prepended pages and
+        destinations are appended to the copy. The copy replaces the output
+        only once it is complete, so an existing output is left untouched
+        if the original cannot be read or updated incrementally. The copy
+        takes the existing output's permissions, or those of a newly
+        created file.
+
+        Returns:
+            True if the output was written, False if the file does not
+            support incremental updates (e.g. it needed repair on opening)
+        """
+        if _is_same_file(original_path, output_path):
+            return self._append_incrementally(
+                prepend_pdf, original_path, create_destinations
+            )
+
+        fd, temp_path = tempfile.mkstemp(
+            suffix=".pdf", dir=os.path.dirname(os.path.abspath(output_path))
+        )
+        os.close(fd)
+        try:
+            shutil.copyfile(original_path, temp_path)
+            if not self._append_incrementally(
+                prepend_pdf, temp_path, create_destinations
+            ):
+                return False
+            # mkstemp creates the file private to the user
+            if os.path.exists(output_path):
+                shutil.copymode(output_path, temp_path)
+            else:
+                os.chmod(temp_path, 0o666 & ~_current_umask())
+            os.replace(temp_path, output_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        return True
+
+    def _append_incrementally(
+        self,
+        prepend_pdf: str | Path | BinaryIO | bytes,
+        path: str | Path,
+        create_destinations: bool = True,
+    ) -> bool:
+        """
+        Prepend pages to a PDF file in place as an incremental update.
+
+        Returns:
+            True if the file was updated, False if it does not support
+            incremental updates
+        """
+        doc = fitz.open(str(path), filetype="pdf")
+
+        try:
+            if not doc.can_save_incrementally():
+                return False
+
+            prepend = _open_document(prepend_pdf)
+            try:
+                doc.insert_pdf(prepend, start_at=0)
+            finally:
+                prepend.close()
+
+            if create_destinations:
+                self._create_named_destinations(doc)
+
+            doc.save(str(path), incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
         finally:
             doc.close()
 
-        return self._write_output(result_bytes, output)
+        return True
+
+    def _add_destinations_and_links(
+        self,
+        doc: fitz.Document,
+        link_positions: list["LinkPosition"],
+        page_offset: int,
+        create_destinations: bool = True,
+    ) -> None:
+        """Create named destinations and link annotations on a merged document."""
+        if create_destinations:
+            self._create_named_destinations(doc)
+        self._add_links(doc, link_positions, page_offset)
+
+    def _create_named_destinations(self, doc: fitz.Document) -> None:
+        """
+        Create a named destination ("page_1", "page_2", ...) for every page.
+
+        Each destination shows its page from the top (/FitH at the top of
+        the MediaBox), as the pypdf backend does. The whole /Dests name
+        tree is written as a single object. Page xrefs are read with
+        ``page_xref``, so pages are only loaded when their MediaBox is
+        inherited.
+
+        Args:
+            doc: PyMuPDF document
+        """
+        # Name tree keys must be sorted; "page_10" sorts before "page_2"
+        names = sorted((f"page_{i + 1}", i) for i in range(len(doc)))
+        entries = []
+        for name, i in names:
+            xref = doc.page_xref(i)
+            top = _pdf_number(_page_top(doc, i, xref))
+            entries.append(f"({name}) [{xref} 0 R /FitH {top}]")
+
+        dests_xref = doc.get_new_xref()
+        doc.update_object(dests_xref, f"<< /Names [{' '.join(entries)}] >>")
+        doc.xref_set_key(doc.pdf_catalog(), "Names/Dests", f"{dests_xref} 0 R")
+
+    def _add_links(
+        self,
+        doc: fitz.Document,
+        link_positions: list["LinkPosition"],
+        page_offset: int = 0,
+    ) -> None:
+        """
+        Add link annotations for all link positions to the document.
+
+        Links are grouped by the page they sit on, so each page is loaded
+        once and each distinct link text is searched for once per page.
+        The annotations of a page are created as plain PDF objects and
+        attached to its /Annots array in a single update.
+
+        Pages are processed serially: PyMuPDF does not support concurrent
+        use of a document from several threads, even on distinct pages.
 
-    def _add_link(self, doc: fitz.Document, link_pos: "LinkPosition") -> None:
+        Args:
+            doc: PyMuPDF document
+            link_positions: List of link positions with coordinates and targets
+            page_offset: Number of pages to add to every link's target page
+        """
+        page_count = len(doc)
+        destinations: dict[int, str] = {}
+        # Links arrive in page order from the generator, so the sort is
+        # close to linear and only keeps arbitrary input grouped correctly
+        ordered = sorted(link_positions, key=attrgetter("page_index"))
+        for page_idx, page_links in groupby(ordered, key=attrgetter("page_index")):
+            if 0 <= page_idx < page_count:
+                page = doc.load_page(page_idx)
+                self._add_page_links(doc, page, page_links, page_offset, destinations)
+
+    def _add_page_links(
+        self,
+        doc: fitz.Document,
+        page: fitz.Page,
+        page_links: Iterable["LinkPosition"],
+        page_offset: int,
+        destinations: dict[int, str],
+    ) -> None:
         """
-        Add a single link annotation to the document.
+        Add the link annotations that sit on one page.
+
+        Args:
+            doc: PyMuPDF document
+            page: The page the links sit on
+            page_links: Link positions on this page
+            page_offset: Number of pages to add to every link's target page
+            destinations: GoTo destinations already built, by target page index
+        """
+        text_cache: dict[str, list[fitz.Rect]] = {}
+        annotations = []
+        for link_pos in page_links:
+            annotation = self._create_link_annotation(
+                doc, page, link_pos, page_offset, text_cache, destinations
+            )
+            if annotation is not None:
+                annotations.append(annotation)
+        _append_annotations(doc, page, annotations)
+
+    def _create_link_annotation(
+        self,
+        doc: fitz.Document,
+        page: fitz.Page,
+        link_pos: "LinkPosition",
+        page_offset: int = 0,
+        text_cache: dict[str, list[fitz.Rect]] | None = None,
+        destinations: dict[int, str] | None = None,
+    ) -> str | None:
+        """
+        Build the PDF source of a single link annotation.
 
         Uses text search to find the exact position of the link text,
         falling back to estimated coordinates if search fails.
 
         Args:
             doc: PyMuPDF document
+            page: The page the link sits on
             link_pos: Link position information
+            page_offset: Number of pages to add to the link's target page
+            text_cache: Search results for link texts already seen on the page
+            destinations: GoTo destinations already built, by target page index
+
+        Returns:
+            The annotation dictionary source, or None if the target page
+            does not exist
         """
-        page_idx = link_pos.page_index
-        target_page_idx = link_pos.target_page - 1  # Convert to 0-based
+        target_page_idx = link_pos.target_page + page_offset - 1  # Convert to 0-based
 
-        # Validate page indices
-        if page_idx < 0 or page_idx >= len(doc):
-            return
+        # Validate target page index
         if target_page_idx < 0 or target_page_idx >= len(doc):
-            return
-
-        page = doc[page_idx]
+            return None
 
         # Try to find the exact position using text search
-        link_rect = self._find_text_rect(page, link_pos)
+        link_rect = self._find_text_rect(page, link_pos, text_cache)
 
         if link_rect is None:
             # Fallback to estimated coordinates
             link_rect = self._get_estimated_rect(page, link_pos)
 
-        # Create internal link to target page
-        link_dict = {
-            "kind": fitz.LINK_GOTO,
-            "from": link_rect,
-            "page": target_page_idx,
-            "to": fitz.Point(0, 0),  # Top of target page
-        }
-
-        try:
-            page.insert_link(link_dict)
-        except Exception:
-            # If link insertion fails, continue without it
-            pass
+        # Internal link to the top of the target page, as PyMuPDF's
+        # insert_link would write it
+        destination = None if destinations is None else destinations.get(target_page_idx)
+        if destination is None:
+            target_page = doc[target_page_idx]
+            top = fitz.Point(0, 0) * ~target_page.transformation_matrix
+            destination = (
+                f"[{target_page.xref} 0 R/XYZ {_pdf_number(top.x)} {_pdf_number(top.y)} 0]"
+            )
+            if destinations is not None:
+                destinations[target_page_idx] = destination
+
+        rect = " ".join(map(_pdf_number, link_rect * ~page.transformation_matrix))
+        return f"<</A<</S/GoTo/D{destination}>>/Rect[{rect}]/BS<</W 0>>/Subtype/Link>>"
 
     def _find_text_rect(
-        self, page: fitz.Page, link_pos: "LinkPosition"
+        self,
+        page: fitz.Page,
+        link_pos: "LinkPosition",
+        text_cache: dict[str, list[fitz.Rect]] | None = None,
     ) -> fitz.Rect | None:
         """
         Find the exact rectangle of link text using PyMuPDF text search.
@@ -109,6 +418,9 @@ class LinkAnnotator:
         Args:
             page: PyMuPDF page object
             link_pos: Link position with text to search for
+            text_cache: Optional search results per link text on this page,
+                filled in as texts are searched for. Matched rectangles are
+                removed from it, so no two links share one.
 
         Returns:
             fitz.Rect if found, None otherwise
@@ -117,30 +429,33 @@ class LinkAnnotator:
             return None
 
         # Search for the link text on the page
-        text_instances = page.search_for(link_pos.link_text)
+        if text_cache is None:
+            text_instances = page.search_for(link_pos.link_text)
+        else:
+            text_instances = text_cache.get(link_pos.link_text)
+            if text_instances is None:
+                text_instances = page.search_for(link_pos.link_text)
+                text_cache[link_pos.link_text] = text_instances
 
         if not text_instances:
             return None
 
-        # If multiple instances found, use the estimated y position to pick the right one
-        if len(text_instances) == 1:
-            return text_instances[0]
-
-        # Multiple instances - find the one closest to our estimated position
-        page_height = page.rect.height
-        estimated_y = page_height - link_pos.y  # Convert to PyMuPDF coordinates
-
-        best_rect = None
-        best_distance = float("inf")
-
-        for rect in text_instances:
-            # Calculate distance from estimated position
-            distance = abs(rect.y1 - estimated_y)
-            if distance < best_distance:
-                best_distance = distance
-                best_rect = rect
-
-        return best_rect
+        # If multiple instances found, use the estimated y position to pick
+        # the one closest to it
+        best = 0
+        if len(text_instances) > 1:
+            estimated_y = page.rect.height - link_pos.y  # Convert to PyMuPDF coordinates
+            best = min(
+                range(len(text_instances)),
+                key=lambda i: abs(text_instances[i].y1 - estimated_y),
+            )
+
+        rect = text_instances[best]
+        if text_cache is not None:
+            # Each occurrence belongs to one link; later links with the same
+            # text are matched against the remaining occurrences
+            del text_instances[best]
+        return rect
 
     def _get_estimated_rect(
         self, page: fitz.Page, link_pos: "LinkPosition"
@@ -165,38 +480,142 @@ class LinkAnnotator:
 
         return fitz.Rect(x0, y0, x1, y1)
 
-    def _write_output(
-        self,
-        pdf_bytes: bytes,
-        output: str | Path | BinaryIO | None,
-    ) -> bytes | None:
-        """Write PDF bytes to output destination."""
+
+def _copy_pdf(
+    source: str | Path | BinaryIO | bytes | bytearray | memoryview,
+    output: str | Path | BinaryIO | None,
+) -> bytes | None:
+    """Copy a PDF from source to output without parsing it."""
+    if isinstance(source, (str, Path)):
         if output is None:
-            return pdf_bytes
+            return Path(source).read_bytes()
         elif isinstance(output, (str, Path)):
-            with open(output, "wb") as f:
-                f.write(pdf_bytes)
-            return None
+            shutil.copyfile(source, output)
         else:
-            output.write(pdf_bytes)
-            return None
+            with open(source, "rb") as f:
+                shutil.copyfileobj(f, output)
+        return None
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        if output is None:
+            return bytes(source)
+        elif isinstance(output, (str, Path)):
+            Path(output).write_bytes(source)
+        else:
+            output.write(source)
+    elif output is None:
+        return source.read()
+    elif isinstance(output, (str, Path)):
+        with open(output, "wb") as f:
+            shutil.copyfileobj(source, f)
+    else:
+        shutil.copyfileobj(source, output)
+    return None
+
+
+def _pdf_number(value: float) -> str:
+    """Format a coordinate as a PDF number (which has no exponent notation)."""
+    return f"{value:.4f}".rstrip("0").rstrip(".")
+
+
+def _page_top(doc: fitz.Document, pno: int, xref: int) -> float:
+    """Return the top of a page's MediaBox in PDF coordinates."""
+    kind, value = doc.xref_get_key(xref, "MediaBox")
+    if kind == "array":
+        try:
+            return float(value.strip("[] ").split()[3])
+        except (IndexError, ValueError):
+            pass
+    # Inherited from the page tree, or not a plain array of numbers
+    return doc[pno].mediabox.y1
+
+
+def _append_annotations(
+    doc: fitz.Document, page: fitz.Page, annotations: list[str]
+) -> None:
+    """Add annotation objects and append them to a page's /Annots array."""
+    if not annotations:
+        return
+
+    refs = []
+    for annotation in annotations:
+        xref = doc.get_new_xref()
+        doc.update_object(xref, annotation)
+        refs.append(f"{xref} 0 R")
+
+    # Keep any annotations the page already has
+    kind, value = doc.xref_get_key(page.xref, "Annots")
+    if kind == "xref":
+        value = doc.xref_object(int(value.split()[0]), compressed=True)
+        kind = "array"
+    if kind == "array":
+        refs.insert(0, value.strip()[1:-1])
+    doc.xref_set_key(page.xref, "Annots", f"[{' '.join(refs)}]")
+
+
+def _current_umask() -> int:
+    """Return the process umask, which can only be read by setting it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _is_same_file(path: str | Path, other: str | Path) -> bool:
+    """Check whether two paths refer to the same existing file."""
+    return os.path.exists(path) and os.path.exists(other) and os.path.samefile(path, other)
+
+
+def _save_document(
+    doc: fitz.Document, output: str | Path | BinaryIO | None
+) -> bytes | None:
+    """
+    Serialize a document to bytes, or save it straight to a path or stream.
+
+    Saving directly avoids holding a second, serialized copy of the PDF
+    in memory before it is written out.
+    """
+    if output is None:
+        return doc.tobytes()
+    doc.save(str(output) if isinstance(output, Path) else output)
+    return None
+
+
+def _open_document(pdf_source: str | Path | BinaryIO | bytes) -> fitz.Document:
+    """Open a PyMuPDF document from a path, bytes-like object, or binary stream."""
+    if isinstance(pdf_source, (str, Path)):
+        return fitz.open(str(pdf_source), filetype="pdf")
+    if isinstance(pdf_source, bytearray):
+        # PyMuPDF borrows bytes and memoryviews but copies a bytearray
+        pdf_source = memoryview(pdf_source)
+    elif not isinstance(pdf_source, (bytes, memoryview, io.BytesIO)):
+        pdf_source = pdf_source.read()
+    return fitz.open(stream=pdf_source, filetype="pdf")
 
 
 def add_links_to_pdf(
-    pdf_bytes: bytes,
+    pdf_bytes: bytes | BinaryIO | None,
     link_positions: list["LinkPosition"],
     output: str | Path | BinaryIO | None = None,
+    page_offset: int = 0,
+    source_path: str | Path | None = None,
 ) -> bytes | None:
     """
     Convenience function to add link annotations to a PDF.
 
     Args:
-        pdf_bytes: The merged PDF bytes
+        pdf_bytes: The merged PDF, as bytes or a stream (None to read it
+            from ``source_path``)
         link_positions: List of link positions
         output: Optional output path or stream
+        page_offset: Number of pages to add to every link's target page
+        source_path: Path of the file the PDF was read from; if pdf_bytes
+            is None and output is the same path, links are appended as an
+            incremental update
 
     Returns:
         PDF bytes if output is None, otherwise None
     """
     annotator = LinkAnnotator()
-    return annotator.add_links(pdf_bytes, link_positions, output)
+    return annotator.add_links(
+        pdf_bytes, link_positions, output, page_offset, source_path=source_path
+    )
@@ -2,10 +2,30 @@
 
 from dataclasses import dataclass, field
 
+# Destination names for the first pages, shared by every manager; names
+# for later pages are formatted on demand so the table never grows
+_DEST_NAME_TABLE_SIZE = 1024
+_DEST_NAMES: tuple[str, ...] = tuple(
+    f"page_{i}" for i in range(_DEST_NAME_TABLE_SIZE)
+)
 
-@dataclass
+
+def _destination_name(page: int) -> str:
+    """Return the destination name for a page number."""
+    if 0 <= page < _DEST_NAME_TABLE_SIZE:
+        return _DEST_NAMES[page]
+    return f"page_{page}"
+
+
+@dataclass(slots=True)
 class LinkInfo:
-    """Information about a link to a page in the original document."""
+    """
+    Information about a link to a page in the original document.
+
+    Links registered with a LinkManager report its current prepended page
+    count applied to their original page, so they follow the count without
+    being updated one by one.
+    """
 
     original_page: int
     adjusted_page: int | None = None
@@ -13,8 +33,28 @@ class LinkInfo:
     @property
     def destination_name(self) -> str:
         """Get the named destination for this link."""
-        page = self.adjusted_page if self.adjusted_page is not None else self.original_page
-        return f"page_{page}"
+        page = self.adjusted_page
+        return _destination_name(page if page is not None else self.original_page)
+
+
+# A registered link keeps its manager in its adjusted_page slot until a
+# page is assigned, and reports the manager's count applied to its
+# original page. The property wraps the slot generated by the dataclass.
+_ADJUSTED_PAGE_SLOT = LinkInfo.adjusted_page
+
+
+def _get_adjusted_page(link: LinkInfo) -> int | None:
+    value = _ADJUSTED_PAGE_SLOT.__get__(link, LinkInfo)
+    if isinstance(value, LinkManager):
+        return link.original_page + value.prepended_page_count
+    return value
+
+
+LinkInfo.adjusted_page = property(
+    _get_adjusted_page,
+    _ADJUSTED_PAGE_SLOT.__set__,
+    doc="The page number in the final document, if known.",
+)
 
 
 @dataclass
@@ -35,6 +75,7 @@ class LinkManager:
             LinkInfo object for this link
         """
         link = LinkInfo(original_page=original_page)
+        _ADJUSTED_PAGE_SLOT.__set__(link, self)
         self._links.append(link)
         return link
 
@@ -42,16 +83,13 @@ class LinkManager:
         """
         Set the number of prepended pages and update all link targets.
 
+        Registered links read the count when asked for their adjusted
+        page, so this does not depend on how many links there are.
+
         Args:
             count: The number of pages being prepended
         """
         self.prepended_page_count = count
-        self._update_all_links()
-
-    def _update_all_links(self) -> None:
-        """Update all registered links with adjusted page numbers."""
-        for link in self._links:
-            link.adjusted_page = link.original_page + self.prepended_page_count
 
     def get_adjusted_page(self, original_page: int) -> int:
         """
@@ -75,8 +113,7 @@ class LinkManager:
         Returns:
             The destination name (e.g., "page_5" after adjusting for offset)
         """
-        adjusted = self.get_adjusted_page(original_page)
-        return f"page_{adjusted}"
+        return _destination_name(original_page + self.prepended_page_count)
 
     def clear(self) -> None:
         """Clear all registered links."""
@@ -97,4 +134,8 @@ class LinkManager:
         Returns:
             List of destination names for all pages
         """
-        return [f"page_{i}" for i in range(1, total_pages + 1)]
+        names = list(_DEST_NAMES[1 : total_pages + 1])
+        names.extend(
+            f"page_{i}" for i in range(_DEST_NAME_TABLE_SIZE, total_pages + 1)
+        )
+        return names
@@ -1,14 +1,18 @@
 """Page generator using ReportLab for PDF content generation."""
 
 import io
+import re
 from dataclasses import dataclass, field
-from typing import BinaryIO
+from functools import lru_cache, partial
+from itertools import accumulate
+from typing import Any, BinaryIO, Callable
 
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
 from reportlab.lib.pagesizes import A4, LEGAL, LETTER
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
 from reportlab.lib.units import inch
+from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import (
     BaseDocTemplate,
     Frame,
@@ -54,12 +58,18 @@ PAGE_SIZE_MAP = {
     PageSize.LEGAL: LEGAL,
 }
 
+# Matches the XML tags produced by the text formatter
+_TAG_RE = re.compile(r"<[^>]+>")
 
-@dataclass
+# Bullet glyph and its trailing space, shared by every bullet point
+_BULLET_CHAR = "\u2022 "
+
+
+@dataclass(slots=True)
 class LinkPosition:
     """Position information for a link to be added after PDF generation."""
     page_index: int  # 0-based page in prepended section
-    target_page: int  # 1-based target page (already adjusted for offset)
+    target_page: int  # 1-based page in the original (LinkAnnotator adds page_offset)
     link_text: str  # The visible link text (for text search fallback)
     x: float  # X position of link (estimated)
     y: float  # Y position of link from bottom (estimated)
@@ -67,15 +77,43 @@ class LinkPosition:
     height: float  # Estimated height
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkInfo:
     """Information about a link's position within text."""
     text: str  # The link text
-    target_page: int  # Adjusted target page
+    target_page: int  # 1-based target page in the original document
     char_start: int  # Character offset where link starts in plain text
     char_end: int  # Character offset where link ends in plain text
 
 
+class _NullCanvas(Canvas):
+    """
+    Canvas used for layout-only passes.
+
+    Platypus still wraps, splits, and paginates flowables against it, but
+    finished pages are discarded instead of being turned into PDF page
+    objects, and nothing is serialized on save.
+    """
+
+    def drawText(self, aTextObject):
+        pass
+
+    def showPage(self):
+        self._startPage()
+
+    def save(self):
+        pass
+
+
+class _Paragraph(Paragraph):
+    """A paragraph that is laid out but not drawn during layout-only passes."""
+
+    def drawOn(self, canvas, x, y, _sW=0):
+        if isinstance(canvas, _NullCanvas):
+            return
+        Paragraph.drawOn(self, canvas, x, y, _sW=_sW)
+
+
 class LinkTrackingParagraph(Flowable):
     """A paragraph that tracks its position for link placement."""
 
@@ -95,7 +133,12 @@ class LinkTrackingParagraph(Flowable):
         self.style = style
         self.link_positions = link_positions
         self.plain_text = plain_text
-        self._para = Paragraph(text, style)
+        self._para = _Paragraph(text, style)
+        # Per-link values that do not depend on where the paragraph is drawn
+        self._link_spans = [
+            (link.text, link.target_page, link.char_start, link.char_end - link.char_start)
+            for link in links
+        ]
 
     def wrap(self, availWidth, availHeight):
         w, h = self._para.wrap(availWidth, availHeight)
@@ -105,6 +148,10 @@ class LinkTrackingParagraph(Flowable):
         return w, h
 
     def draw(self):
+        # Nothing to draw or record during layout-only passes
+        if isinstance(self.canv, _NullCanvas):
+            return
+
         # Draw the paragraph
         self._para.drawOn(self.canv, 0, 0)
 
@@ -118,24 +165,117 @@ class LinkTrackingParagraph(Flowable):
             # Calculate average character width based on paragraph width and plain text length
             plain_len = len(self.plain_text) if self.plain_text else 1
             avg_char_width = self.width / max(plain_len, 1)
+            height = self.height
 
-            for link_info in self.links:
-                # Estimate link position based on character offsets
-                link_x = x + (link_info.char_start * avg_char_width)
-                link_width = (link_info.char_end - link_info.char_start) * avg_char_width
-
-                # Ensure minimum clickable width
-                link_width = max(link_width, 20)
-
-                self.link_positions.append(LinkPosition(
+            # Estimate link positions based on character offsets, ensuring
+            # a minimum clickable width
+            self.link_positions.extend(
+                LinkPosition(
                     page_index=page_idx,
-                    target_page=link_info.target_page,
-                    link_text=link_info.text,  # Include text for search fallback
-                    x=link_x,
+                    target_page=target_page,
+                    link_text=text,  # Include text for search fallback
+                    x=x + char_start * avg_char_width,
                     y=y,
-                    width=link_width,
-                    height=self.height,
-                ))
+                    width=max(length * avg_char_width, 20),
+                    height=height,
+                )
+                for text, target_page, char_start, length in self._link_spans
+            )
+
+
+@lru_cache(maxsize=None)
+def _build_stylesheet(font_size: int) -> StyleSheet1:
+    """
+    Build the paragraph styles used for prepended pages.
+
+    Style sheets depend only on the base font size (bounded by the schema),
+    so they are built once per size and shared by every PageGenerator.
+    They must not be modified.
+    """
+    styles = getSampleStyleSheet()
+
+    # Base style for normal text
+    styles.add(
+        ParagraphStyle(
+            name="PrependNormal",
+            parent=styles["Normal"],
+            fontSize=font_size,
+            leading=font_size * 1.2,
+            spaceAfter=6,
+        )
+    )
+
+    # Page heading style
+    styles.add(
+        ParagraphStyle(
+            name="PrependPageHeading",
+            parent=styles["PrependNormal"],
+            fontSize=18,
+            leading=22,
+            spaceAfter=12,
+            spaceBefore=0,
+        )
+    )
+
+    # Section heading style
+    styles.add(
+        ParagraphStyle(
+            name="PrependSectionHeading",
+            parent=styles["PrependNormal"],
+            fontSize=14,
+            leading=18,
+            spaceBefore=12,
+            spaceAfter=6,
+        )
+    )
+
+    # Section subheading style
+    styles.add(
+        ParagraphStyle(
+            name="PrependSectionSubheading",
+            parent=styles["PrependNormal"],
+            fontSize=12,
+            leading=15,
+            spaceBefore=6,
+            spaceAfter=6,
+        )
+    )
+
+    # Bullet point style
+    styles.add(
+        ParagraphStyle(
+            name="PrependBullet",
+            parent=styles["PrependNormal"],
+            leftIndent=20,
+            bulletIndent=0,
+            spaceBefore=3,
+            spaceAfter=3,
+        )
+    )
+
+    # Indented bullet point style
+    styles.add(
+        ParagraphStyle(
+            name="PrependIndentedBullet",
+            parent=styles["PrependBullet"],
+            leftIndent=40,
+            bulletIndent=20,
+        )
+    )
+
+    return styles
+
+
+@lru_cache(maxsize=32)
+def _get_text_formatter(bold_marker: str, italic_marker: str) -> TextFormatter:
+    """
+    Get a text formatter for the given markers.
+
+    Formatters keep no state between calls, so one instance (and its
+    compiled patterns) is shared by every PageGenerator using the same
+    markers.
+    """
+    return TextFormatter(bold_marker=bold_marker, italic_marker=italic_marker)
 
 
 class PageGenerator:
@@ -156,85 +296,26 @@ class PageGenerator:
         self.spec = spec
         self.defaults = spec.defaults
         self.link_manager = link_manager or LinkManager()
-        self.text_formatter = TextFormatter(
-            bold_marker=self.defaults.bold_marker,
-            italic_marker=self.defaults.italic_marker,
+        self.text_formatter = _get_text_formatter(
+            self.defaults.bold_marker, self.defaults.italic_marker
         )
         self.link_positions: list[LinkPosition] = []
+        self._style_cache: dict[tuple[str, int | None, Alignment], ParagraphStyle] = {}
+        # Escaped texts and link markup, reused for repeated texts
+        self._escape_cache: dict[str, str] = {}
+        self._link_markup: dict[str, str] = {}
+        # Flowable builders by content element type
+        self._element_builders: dict[type, Callable[[Any], list[Flowable]]] = {
+            SectionHeading: self._build_section_heading,
+            SectionSubheading: self._build_section_subheading,
+            BulletPoint: partial(self._build_bullet_point, indented=False),
+            IndentedBulletPoint: partial(self._build_bullet_point, indented=True),
+        }
         self._setup_styles()
 
     def _setup_styles(self) -> None:
         """Set up ReportLab paragraph styles."""
-        self.styles = getSampleStyleSheet()
-
-        # Base style for normal text
-        self.styles.add(
-            ParagraphStyle(
-                name="PrependNormal",
-                parent=self.styles["Normal"],
-                fontSize=self.defaults.font_size,
-                leading=self.defaults.font_size * 1.2,
-                spaceAfter=6,
-            )
-        )
-
-        # Page heading style
-        self.styles.add(
-            ParagraphStyle(
-                name="PrependPageHeading",
-                parent=self.styles["PrependNormal"],
-                fontSize=18,
-                leading=22,
-                spaceAfter=12,
-                spaceBefore=0,
-            )
-        )
-
-        # Section heading style
-        self.styles.add(
-            ParagraphStyle(
-                name="PrependSectionHeading",
-                parent=self.styles["PrependNormal"],
-                fontSize=14,
-                leading=18,
-                spaceBefore=12,
-                spaceAfter=6,
-            )
-        )
-
-        # Section subheading style
-        self.styles.add(
-            ParagraphStyle(
-                name="PrependSectionSubheading",
-                parent=self.styles["PrependNormal"],
-                fontSize=12,
-                leading=15,
-                spaceBefore=6,
-                spaceAfter=6,
-            )
-        )
-
-        # Bullet point style
-        self.styles.add(
-            ParagraphStyle(
-                name="PrependBullet",
-                parent=self.styles["PrependNormal"],
-                leftIndent=20,
-                bulletIndent=0,
-                spaceBefore=3,
-                spaceAfter=3,
-            )
-        )
-
-        # Indented bullet point style
-        self.styles.add(
-            ParagraphStyle(
-                name="PrependIndentedBullet",
-                parent=self.styles["PrependBullet"],
-                leftIndent=40,
-                bulletIndent=20,
-            )
-        )
+        self.styles = _build_stylesheet(self.defaults.font_size)
 
     def _get_style(
         self,
@@ -242,19 +323,28 @@ class PageGenerator:
         font_size: int | None = None,
         alignment: Alignment = Alignment.LEFT,
     ) -> ParagraphStyle:
-        """Get a paragraph style, optionally modified."""
+        """
+        Get a paragraph style, optionally modified.
+
+        Modified styles are cached, since the same size and alignment
+        usually recur across many elements.
+        """
         base = self.styles[base_style_name]
 
         if font_size is None and alignment == Alignment.LEFT:
             return base
 
-        return ParagraphStyle(
-            name=f"{base_style_name}_modified",
-            parent=base,
-            fontSize=font_size or base.fontSize,
-            leading=(font_size or base.fontSize) * 1.2,
-            alignment=ALIGNMENT_MAP.get(alignment, TA_LEFT),
-        )
+        key = (base_style_name, font_size, alignment)
+        style = self._style_cache.get(key)
+        if style is None:
+            style = self._style_cache[key] = ParagraphStyle(
+                name=f"{base_style_name}_modified",
+                parent=base,
+                fontSize=font_size or base.fontSize,
+                leading=(font_size or base.fontSize) * 1.2,
+                alignment=ALIGNMENT_MAP.get(alignment, TA_LEFT),
+            )
+        return style
 
     def _build_page_heading(self, heading: PageHeading) -> list[Flowable]:
         """Build flowables for a page heading."""
@@ -266,10 +356,10 @@ class PageGenerator:
             alignment=heading.alignment,
         )
 
-        text = self.text_formatter.escape_xml(heading.text)
+        text = self._escape(heading.text)
         text = self.text_formatter.apply_style(text, bold=heading.bold, italic=heading.italic)
 
-        flowables.append(Paragraph(text, style))
+        flowables.append(_Paragraph(text, style))
         flowables.append(Spacer(1, 12))
 
         return flowables
@@ -283,12 +373,9 @@ class PageGenerator:
         )
 
         text = self.text_formatter.format_text(element.text)
-        if element.bold:
-            text = f"<b>{text}</b>"
-        if element.italic:
-            text = f"<i>{text}</i>"
+        text = self.text_formatter.apply_style(text, bold=element.bold, italic=element.italic)
 
-        return [Paragraph(text, style)]
+        return [_Paragraph(text, style)]
 
     def _build_section_subheading(self, element: SectionSubheading) -> list[Flowable]:
         """Build flowables for a section subheading."""
@@ -299,73 +386,84 @@ class PageGenerator:
         )
 
         text = self.text_formatter.format_text(element.text)
-        if element.bold:
-            text = f"<b>{text}</b>"
-        if element.italic:
-            text = f"<i>{text}</i>"
+        text = self.text_formatter.apply_style(text, bold=element.bold, italic=element.italic)
+
+        return [_Paragraph(text, style)]
+
+    def _normalize_content(
+        self, content: list[str | LinkableItem]
+    ) -> list[tuple[str, str, int | None]]:
+        """
+        Reduce content items to (kind, text, target page) tuples.
 
-        return [Paragraph(text, style)]
+        Kinds are "text" for plain text with formatting markers, "link" for
+        linkable items, and "literal" for other values, which are only
+        escaped. Dict items (from specifications built without validation)
+        are accepted as well.
+        """
+        normalized: list[tuple[str, str, int | None]] = []
+        for item in content:
+            if isinstance(item, str):
+                normalized.append(("text", item, None))
+            elif isinstance(item, LinkableItem):
+                normalized.append(("link", item.text, item.target_page))
+            elif isinstance(item, dict) and ("targetPage" in item or "target_page" in item):
+                target = item.get("targetPage") or item.get("target_page")
+                normalized.append(("link", item["text"], target))
+            elif isinstance(item, dict):
+                normalized.append(("literal", str(item), None))
+            else:
+                normalized.append(("text", str(item), None))
+        return normalized
 
     def _build_content_items(self, content: list[str | LinkableItem]) -> tuple[str, list[LinkInfo], str]:
         """
         Build formatted content string from content items.
 
+        Items are joined with ", "; each item's offset in the plain text is
+        the running total of the preceding item and separator lengths.
+
         Returns:
             Tuple of (formatted string, list of LinkInfo, plain text for position calculation)
         """
-        formatted_parts = []
-        plain_parts = []
-        links = []
-        current_pos = 0  # Track position in plain text
-
-        for i, item in enumerate(content):
-            # Add separator before this item (except first)
-            if i > 0:
-                formatted_parts.append(", ")
-                plain_parts.append(", ")
-                current_pos += 2
-
-            if isinstance(item, LinkableItem):
-                adjusted_page = self.link_manager.get_adjusted_page(item.target_page)
-                escaped_text = self.text_formatter.escape_xml(item.text)
-                # Style as blue underlined text
-                formatted_parts.append(f'<font color="blue"><u>{escaped_text}</u></font>')
-                plain_parts.append(item.text)
-                # Record link position
-                links.append(LinkInfo(
-                    text=item.text,
-                    target_page=adjusted_page,
-                    char_start=current_pos,
-                    char_end=current_pos + len(item.text),
-                ))
-                current_pos += len(item.text)
-            elif isinstance(item, dict):
-                if "targetPage" in item or "target_page" in item:
-                    target = item.get("targetPage") or item.get("target_page")
-                    adjusted_page = self.link_manager.get_adjusted_page(target)
-                    link_text = item["text"]
-                    escaped_text = self.text_formatter.escape_xml(link_text)
-                    formatted_parts.append(f'<font color="blue"><u>{escaped_text}</u></font>')
-                    plain_parts.append(link_text)
-                    links.append(LinkInfo(
-                        text=link_text,
-                        target_page=adjusted_page,
-                        char_start=current_pos,
-                        char_end=current_pos + len(link_text),
-                    ))
-                    current_pos += len(link_text)
-                else:
-                    text = str(item)
-                    formatted_parts.append(self.text_formatter.escape_xml(text))
-                    plain_parts.append(text)
-                    current_pos += len(text)
-            else:
-                text = str(item)
-                formatted_parts.append(self.text_formatter.format_text(text))
-                plain_parts.append(text)
-                current_pos += len(text)
+        items = self._normalize_content(content)
 
-        return "".join(formatted_parts), links, "".join(plain_parts)
+        formatted = ", ".join([self._format_content_item(kind, text) for kind, text, _ in items])
+        plain_text = ", ".join([text for _, text, _ in items])
+
+        offsets = accumulate((len(text) + 2 for _, text, _ in items), initial=0)
+        links = [
+            LinkInfo(
+                text=text,
+                target_page=self.link_manager.get_adjusted_page(target),
+                char_start=start,
+                char_end=start + len(text),
+            )
+            for (kind, text, target), start in zip(items, offsets)
+            if kind == "link"
+        ]
+
+        return formatted, links, plain_text
+
+    def _format_content_item(self, kind: str, text: str) -> str:
+        """Format one normalized content item as paragraph markup."""
+        if kind == "text":
+            return self.text_formatter.format_text(text)
+        if kind == "link":
+            # Style as blue underlined text
+            markup = self._link_markup.get(text)
+            if markup is None:
+                markup = f'<font color="blue"><u>{self._escape(text)}</u></font>'
+                self._link_markup[text] = markup
+            return markup
+        return self._escape(text)
+
+    def _escape(self, text: str) -> str:
+        """Escape XML characters, memoized for texts that recur."""
+        escaped = self._escape_cache.get(text)
+        if escaped is None:
+            escaped = self._escape_cache[text] = self.text_formatter.escape_xml(text)
+        return escaped
 
     def _build_bullet_point(
         self,
@@ -378,14 +476,14 @@ class PageGenerator:
 
         label = self.text_formatter.format_text(element.label)
         # Get plain label text (strip XML tags for position calculation)
-        plain_label = self._strip_xml_tags(element.label)
+        plain_label = _TAG_RE.sub("", label)
 
         content_str, links, plain_content = self._build_content_items(element.content)
-        bullet_text = f"\u2022 {label} {content_str}"
+        bullet_text = f"{_BULLET_CHAR}{label} {content_str}"
 
         # Build plain text for position calculation
         # Account for bullet, space, label, space before content
-        bullet_prefix = f"\u2022 {plain_label} "
+        bullet_prefix = f"{_BULLET_CHAR}{plain_label} "
         plain_text = bullet_prefix + plain_content
 
         # Adjust link positions to account for the bullet prefix
@@ -406,7 +504,7 @@ class PageGenerator:
                 bullet_text, adjusted_links, style, self.link_positions, plain_text
             )
         else:
-            flowable = Paragraph(bullet_text, style)
+            flowable = _Paragraph(bullet_text, style)
 
         if element.overflow_behavior == OverflowBehavior.WRAP_WITH_PAGE_BREAK:
             return [KeepTogether([flowable])]
@@ -419,31 +517,22 @@ class PageGenerator:
                 return [LinkTrackingParagraph(
                     bullet_text, adjusted_links, no_wrap_style, self.link_positions, plain_text
                 )]
-            return [Paragraph(bullet_text, no_wrap_style)]
+            return [_Paragraph(bullet_text, no_wrap_style)]
         else:
             return [flowable]
 
-    def _strip_xml_tags(self, text: str) -> str:
-        """Remove XML tags from text for position calculation."""
-        import re
-        # Remove bold/italic markers first
-        result = self.text_formatter.format_text(text)
-        # Then remove any XML tags
-        result = re.sub(r'<[^>]+>', '', result)
-        return result
-
     def _build_content_element(self, element: ContentElement) -> list[Flowable]:
         """Build flowables for a content element."""
-        if isinstance(element, SectionHeading):
-            return self._build_section_heading(element)
-        elif isinstance(element, SectionSubheading):
-            return self._build_section_subheading(element)
-        elif isinstance(element, BulletPoint):
-            return self._build_bullet_point(element, indented=False)
-        elif isinstance(element, IndentedBulletPoint):
-            return self._build_bullet_point(element, indented=True)
-        else:
-            return []
+        builder = self._element_builders.get(type(element))
+        if builder is None:
+            # Subclasses of the element models are not in the table
+            for element_type, candidate in self._element_builders.items():
+                if isinstance(element, element_type):
+                    builder = candidate
+                    break
+            else:
+                return []
+        return builder(element)
 
     def _build_page(self, page: Page, is_first: bool = False) -> list[Flowable]:
         """Build flowables for a page."""
@@ -460,16 +549,17 @@ class PageGenerator:
 
         return flowables
 
-    def generate(self) -> tuple[bytes, int, list[LinkPosition]]:
+    def _build_document(self, buffer: BinaryIO, canvasmaker: type[Canvas] = Canvas) -> int:
         """
-        Generate the PDF content.
+        Lay out all pages of the specification onto a canvas.
+
+        Args:
+            buffer: Binary stream the canvas writes the PDF into
+            canvasmaker: Canvas class used for rendering
 
         Returns:
-            Tuple of (PDF bytes, page count, list of link positions)
+            Number of pages laid out
         """
-        self.link_positions.clear()
-        buffer = io.BytesIO()
-
         page_size = PAGE_SIZE_MAP.get(self.defaults.page_size, LETTER)
 
         doc = BaseDocTemplate(
@@ -496,8 +586,38 @@ class PageGenerator:
         for i, page in enumerate(self.spec.pages):
             flowables.extend(self._build_page(page, is_first=(i == 0)))
 
-        doc.build(flowables)
-        page_count = doc.page
+        doc.build(flowables, canvasmaker=canvasmaker)
+        return doc.page
+
+    def plan(self) -> int:
+        """
+        Paginate the content without rendering it.
+
+        Runs the same layout as generate() but draws onto a canvas that
+        discards its output, so no PDF content is produced.
+
+        Returns:
+            Number of pages the content occupies
+        """
+        self.link_positions.clear()
+        page_count = self._build_document(io.BytesIO(), canvasmaker=_NullCanvas)
+        self.link_positions.clear()
+        return page_count
+
+    def generate(self) -> tuple[bytes, int, list[LinkPosition]]:
+        """
+        Generate the PDF content.
+
+        Returns:
+            Tuple of (PDF bytes, page count, list of link positions)
+        """
+        self.link_positions.clear()
+        # Bound the text caches to one generation
+        self._escape_cache.clear()
+        self._link_markup.clear()
+        buffer = io.BytesIO()
+
+        page_count = self._build_document(buffer)
 
         buffer.seek(0)
         return buffer.getvalue(), page_count, list(self.link_positions)
@@ -506,12 +626,14 @@ class PageGenerator:
         """
         Generate the PDF content to a stream.
 
+        ReportLab writes the document into the stream directly; link
+        positions are left in ``link_positions``.
+
         Args:
             stream: Binary stream to write to
 
         Returns:
             Number of pages generated
         """
-        pdf_bytes, page_count, _ = self.generate()
-        stream.write(pdf_bytes)
-        return page_count
+        self.link_positions.clear()
+        return self._build_document(stream)
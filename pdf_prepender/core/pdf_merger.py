@@ -1,36 +1,85 @@
 """PDF merger using pypdf for prepending and named destination creation."""
 
 import io
+import mmap
+import re
+import warnings
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO
+from typing import TYPE_CHECKING, BinaryIO, Sequence
 
-from pypdf import PdfReader, PdfWriter
-from pypdf.annotations import Link
+from pypdf import PageObject, PdfReader, PdfWriter
 from pypdf.generic import (
     ArrayObject,
     DictionaryObject,
-    Fit,
+    FloatObject,
     NameObject,
     NumberObject,
+    RectangleObject,
+    TextStringObject,
 )
 
 if TYPE_CHECKING:
     from pdf_prepender.core.page_generator import LinkPosition
 
+# Patterns for locating the page count without parsing the whole PDF
+_STARTXREF_RE = re.compile(rb"startxref\s+(\d+)")
+_XREF_SUBSECTION_RE = re.compile(rb"\s*(\d+)\s+(\d+)")
+_XREF_ENTRY_RE = re.compile(rb"\s*(\d{10})\s+\d{5}\s+([nf])")
+_OBJ_HEADER_RE = re.compile(rb"\s*(\d+)\s+\d+\s+obj")
+_ROOT_RE = re.compile(rb"/Root\s+(\d+)\s+\d+\s+R")
+_PREV_RE = re.compile(rb"/Prev\s+(\d+)")
+_PAGES_RE = re.compile(rb"/Pages\s+(\d+)\s+\d+\s+R")
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)\b(?!\s+\d+\s+R)")
+
+
+# Backends PdfMerger can merge with
+_BACKENDS = ("pypdf", "pymupdf")
+
 
 class PdfMerger:
-    """Handles PDF merging, prepending, and named destination creation."""
+    """
+    Handles PDF merging, prepending, and named destination creation.
 
-    def __init__(self):
-        """Initialize the PDF merger."""
+    The two backends place links differently. pypdf puts each link at the
+    exact rectangle given by its LinkPosition. PyMuPDF, like
+    LinkAnnotator, searches the page for the link text and uses the match
+    nearest that position, falling back to the position itself when the
+    text is not found.
+    """
+
+    def __init__(self, backend: str = "pypdf"):
+        """
+        Initialize the PDF merger.
+
+        Args:
+            backend: Library used for merging. "pypdf" (the default) copies
+                pages with pypdf; "pymupdf" merges in PyMuPDF, which parses
+                and writes large documents much faster. With "pymupdf",
+                links are placed by searching for their text, as in
+                LinkAnnotator, and readers passed in are still merged with
+                pypdf.
+
+        Raises:
+            ValueError: If the backend is not supported
+        """
+        if backend not in _BACKENDS:
+            raise ValueError(
+                f"Unsupported backend {backend!r}; expected one of {', '.join(_BACKENDS)}"
+            )
+        self.backend = backend
         self.writer = PdfWriter()
+        # Set once a merge bypasses self.writer, which write_to cannot emit
+        self._merged_with_pymupdf = False
 
-    def get_page_count(self, pdf_source: str | Path | BinaryIO | bytes) -> int:
+    def get_page_count(
+        self, pdf_source: str | Path | BinaryIO | bytes | PdfReader
+    ) -> int:
         """
         Get the page count of a PDF.
 
         Args:
-            pdf_source: Path to PDF file, file object, or bytes
+            pdf_source: Path to PDF file, file object, bytes, or an open
+                reader (which can then be passed on to a merge method)
 
         Returns:
             Number of pages in the PDF
@@ -38,27 +87,24 @@ class PdfMerger:
         reader = self._create_reader(pdf_source)
         return len(reader.pages)
 
-    def _create_reader(self, pdf_source: str | Path | BinaryIO | bytes) -> PdfReader:
+    def _create_reader(
+        self, pdf_source: str | Path | BinaryIO | bytes | PdfReader
+    ) -> PdfReader:
         """
         Create a PdfReader from various source types.
 
         Args:
-            pdf_source: Path to PDF file, file object, or bytes
+            pdf_source: Path to PDF file, file object, bytes, or an open reader
 
         Returns:
             PdfReader instance
         """
-        if isinstance(pdf_source, bytes):
-            return PdfReader(io.BytesIO(pdf_source))
-        elif isinstance(pdf_source, (str, Path)):
-            return PdfReader(str(pdf_source))
-        else:
-            return PdfReader(pdf_source)
+        return open_pdf_reader(pdf_source)
 
     def prepend_pages(
         self,
-        prepend_pdf: str | Path | BinaryIO | bytes,
-        original_pdf: str | Path | BinaryIO | bytes,
+        prepend_pdf: str | Path | BinaryIO | bytes | PdfReader,
+        original_pdf: str | Path | BinaryIO | bytes | PdfReader,
         output: str | Path | BinaryIO | None = None,
         create_destinations: bool = True,
     ) -> bytes | None:
@@ -66,15 +112,27 @@ class PdfMerger:
         Prepend pages from one PDF to another.
 
         Args:
-            prepend_pdf: PDF to prepend (new pages at the beginning)
-            original_pdf: Original PDF to append to
+            prepend_pdf: PDF to prepend (new pages at the beginning); may be
+                an already open reader
+            original_pdf: Original PDF to append to (may be an already open
+                reader)
             output: Optional output path or stream (if None, returns bytes)
             create_destinations: Whether to create named destinations for all pages
 
         Returns:
             PDF bytes if output is None, otherwise None
         """
+        # Readers passed in are merged with pypdf, as in the other methods
+        has_reader = isinstance(prepend_pdf, PdfReader) or isinstance(
+            original_pdf, PdfReader
+        )
+        if self.backend == "pymupdf" and not has_reader:
+            return self._merge_with_pymupdf(
+                prepend_pdf, original_pdf, None, output, create_destinations
+            )
+
         self.writer = PdfWriter()
+        self._merged_with_pymupdf = False
 
         # Read both PDFs
         prepend_reader = self._create_reader(prepend_pdf)
@@ -84,152 +142,234 @@ class PdfMerger:
         for page in prepend_reader.pages:
             self.writer.add_page(page)
 
-        prepend_count = len(prepend_reader.pages)
-
         # Add original pages
         for page in original_reader.pages:
             self.writer.add_page(page)
 
-        total_pages = len(self.writer.pages)
-
         # Create named destinations for all pages
         if create_destinations:
-            self._create_named_destinations(total_pages)
+            self._create_named_destinations(self.writer.pages)
 
         # Output the result
+        return self.write_to(output)
+
+    def write_to(self, output: str | Path | BinaryIO | None = None) -> bytes | None:
+        """
+        Write the last merged PDF to a path or stream, or return it as bytes.
+
+        pypdf writes straight into the file or stream, with no intermediate
+        buffer. For bytes, the buffer's contents are handed over by
+        getvalue() without another copy.
+
+        Args:
+            output: Optional output path or stream (if None, returns bytes)
+
+        Returns:
+            PDF bytes if output is None, otherwise None
+
+        Raises:
+            RuntimeError: If the last merge was done with the "pymupdf"
+                backend, whose result is not kept in the pypdf writer
+        """
+        if self._merged_with_pymupdf:
+            raise RuntimeError(
+                "write_to is not available after a merge with the pymupdf "
+                "backend; pass an output to the merge method instead"
+            )
         if output is None:
             buffer = io.BytesIO()
             self.writer.write(buffer)
-            buffer.seek(0)
             return buffer.getvalue()
         elif isinstance(output, (str, Path)):
             with open(output, "wb") as f:
                 self.writer.write(f)
-            return None
         else:
             self.writer.write(output)
-            return None
+        return None
 
-    def _create_named_destinations(self, total_pages: int) -> None:
+    def _create_named_destinations(self, pages: Sequence[PageObject]) -> None:
         """
         Create named destinations for all pages.
 
+        The /Dests name tree is filled in one assignment, with its entries
+        sorted by name as the PDF spec requires, instead of inserting each
+        destination with PdfWriter.add_named_destination, which scans the
+        whole array on every call. Each destination fits the page width
+        at the top of the page, as add_named_destination does.
+
         Args:
-            total_pages: Total number of pages in the document
+            pages: All pages of the document, as added to the writer
         """
-        for i in range(total_pages):
-            dest_name = f"page_{i + 1}"
-            self.writer.add_named_destination(
-                title=dest_name,
-                page_number=i,
+        fit_h = NameObject("/FitH")
+        entries = [
+            (
+                f"page_{i + 1}",
+                ArrayObject(
+                    [
+                        page.indirect_reference,
+                        fit_h,
+                        FloatObject(page.mediabox.top),
+                    ]
+                ),
             )
+            for i, page in enumerate(pages)
+        ]
+
+        named_dest = self.writer.get_named_dest_root()
+        # Keep any destinations the tree already holds
+        entries.extend(zip(named_dest[::2], named_dest[1::2]))
+        entries.sort(key=lambda entry: entry[0])
+        named_dest[:] = [
+            obj
+            for title, dest in entries
+            for obj in (TextStringObject(title), dest)
+        ]
 
     def merge_with_destinations_and_links(
         self,
-        prepend_bytes: bytes,
-        original_pdf: str | Path | BinaryIO | bytes,
+        prepend_bytes: bytes | BinaryIO,
+        original_pdf: str | Path | BinaryIO | bytes | PdfReader,
         link_positions: list["LinkPosition"] | None = None,
         output: str | Path | BinaryIO | None = None,
     ) -> bytes | None:
         """
         Merge prepended pages with original PDF, create destinations, and add link annotations.
 
-        This is the main method for the two-pass generation approach.
+        Link targets must already be page numbers in the merged document.
+        DocumentBuilder merges with LinkAnnotator instead, which takes
+        targets in the original document and applies the page offset itself.
+
+        With the "pypdf" backend each link is placed at its exact position;
+        with "pymupdf" it is placed on the matching link text, if found
+        (see the class docstring).
 
         Args:
-            prepend_bytes: Bytes of the prepended PDF (already generated)
-            original_pdf: Original PDF to append to
+            prepend_bytes: The prepended PDF (already generated), as bytes or a stream
+            original_pdf: Original PDF to append to (may be an already open reader)
             link_positions: List of link positions for creating clickable links
             output: Optional output path or stream
 
         Returns:
             PDF bytes if output is None, otherwise None
         """
+        if self.backend == "pymupdf" and not isinstance(original_pdf, PdfReader):
+            return self._merge_with_pymupdf(
+                prepend_bytes, original_pdf, link_positions, output
+            )
+
         self.writer = PdfWriter()
+        self._merged_with_pymupdf = False
 
         # Read both PDFs
-        prepend_reader = PdfReader(io.BytesIO(prepend_bytes))
+        prepend_reader = self._create_reader(prepend_bytes)
         original_reader = self._create_reader(original_pdf)
 
-        prepend_count = len(prepend_reader.pages)
-        original_count = len(original_reader.pages)
-
-        # Add prepended pages
-        for page in prepend_reader.pages:
+        # Add prepended pages, then original pages, in one pass, keeping
+        # the writer's copies for the destinations and links below
+        pages = [
             self.writer.add_page(page)
-
-        # Add original pages
-        for page in original_reader.pages:
-            self.writer.add_page(page)
-
-        total_pages = prepend_count + original_count
+            for reader in (prepend_reader, original_reader)
+            for page in reader.pages
+        ]
 
         # Create named destinations for all pages
-        for i in range(total_pages):
-            dest_name = f"page_{i + 1}"
-            self.writer.add_named_destination(
-                title=dest_name,
-                page_number=i,
-            )
+        self._create_named_destinations(pages)
 
         # Add link annotations at exact positions
         if link_positions:
-            self._add_link_annotations(link_positions)
+            self._add_link_annotations(link_positions, pages)
 
         # Output the result
-        if output is None:
-            buffer = io.BytesIO()
-            self.writer.write(buffer)
-            buffer.seek(0)
-            return buffer.getvalue()
-        elif isinstance(output, (str, Path)):
-            with open(output, "wb") as f:
-                self.writer.write(f)
-            return None
-        else:
-            self.writer.write(output)
-            return None
+        return self.write_to(output)
+
+    def _merge_with_pymupdf(
+        self,
+        prepend_pdf: str | Path | BinaryIO | bytes,
+        original_pdf: str | Path | BinaryIO | bytes,
+        link_positions: list["LinkPosition"] | None,
+        output: str | Path | BinaryIO | None,
+        create_destinations: bool = True,
+    ) -> bytes | None:
+        """Merge, create destinations, and add links in one PyMuPDF document."""
+        # Imported here so the pypdf backend does not load PyMuPDF
+        from pdf_prepender.core.link_annotator import LinkAnnotator
+
+        self._merged_with_pymupdf = True
+
+        annotator = LinkAnnotator()
+        return annotator.merge_and_add_links(
+            prepend_pdf=prepend_pdf,
+            original_pdf=original_pdf,
+            link_positions=link_positions or [],
+            output=output,
+            create_destinations=create_destinations,
+        )
 
-    def _add_link_annotations(self, link_positions: list["LinkPosition"]) -> None:
+    def _add_link_annotations(
+        self, link_positions: list["LinkPosition"], pages: Sequence[PageObject]
+    ) -> None:
         """
         Add link annotations to pages at exact positions.
 
+        Links are grouped by page, and each page's annotation dictionaries
+        are built directly and added to its /Annots array in one go,
+        rather than going through PdfWriter.add_annotation once per link.
+
         Args:
             link_positions: List of link positions with coordinates
+            pages: All pages of the document, as added to the writer
         """
+        # Links on or to pages outside the document are dropped while
+        # grouping, so the loops below need no bounds checks
+        page_count = len(pages)
+        links_by_page: dict[int, list["LinkPosition"]] = {}
         for link_pos in link_positions:
-            page_idx = link_pos.page_index
-            target_page_idx = link_pos.target_page - 1  # Convert to 0-based
-
-            if page_idx >= len(self.writer.pages):
-                continue
-            if target_page_idx < 0 or target_page_idx >= len(self.writer.pages):
-                continue
-
-            # Use the exact coordinates from the link position
-            rect = (
-                link_pos.x,  # x1 (left)
-                link_pos.y,  # y1 (bottom)
-                link_pos.x + link_pos.width,  # x2 (right)
-                link_pos.y + link_pos.height,  # y2 (top)
-            )
-
-            # Create link annotation
-            try:
-                link_annotation = Link(
-                    rect=rect,
-                    target_page_index=target_page_idx,
-                    fit=Fit.fit(),
+            if 0 <= link_pos.page_index < page_count and (
+                1 <= link_pos.target_page <= page_count
+            ):
+                links_by_page.setdefault(link_pos.page_index, []).append(link_pos)
+
+        add_object = self.writer._add_object
+        type_key, subtype_key = NameObject("/Type"), NameObject("/Subtype")
+        annot, link = NameObject("/Annot"), NameObject("/Link")
+        rect_key, border_key = NameObject("/Rect"), NameObject("/Border")
+        dest_key, parent_key = NameObject("/Dest"), NameObject("/P")
+        fit = NameObject("/Fit")
+        for page_idx, page_links in links_by_page.items():
+            page = pages[page_idx]
+            page_ref = page.indirect_reference
+
+            new_annots = []
+            for link_pos in page_links:
+                x, y = link_pos.x, link_pos.y
+                target_ref = pages[link_pos.target_page - 1].indirect_reference
+
+                # Use the exact coordinates from the link position
+                annotation = DictionaryObject(
+                    {
+                        type_key: annot,
+                        subtype_key: link,
+                        # Left, bottom, right, top
+                        rect_key: RectangleObject(
+                            (x, y, x + link_pos.width, y + link_pos.height)
+                        ),
+                        border_key: ArrayObject([NumberObject(0)] * 3),
+                        dest_key: ArrayObject([target_ref, fit]),
+                        parent_key: page_ref,
+                    }
                 )
-                self.writer.add_annotation(page_number=page_idx, annotation=link_annotation)
-            except Exception:
-                # If annotation fails, continue without it
-                pass
+                new_annots.append(add_object(annotation))
+
+            annots = page.get("/Annots")
+            if annots is None:
+                page[NameObject("/Annots")] = ArrayObject(new_annots)
+            else:
+                annots.get_object().extend(new_annots)
 
     def merge_with_destinations(
         self,
-        prepend_bytes: bytes,
-        original_pdf: str | Path | BinaryIO | bytes,
+        prepend_bytes: bytes | BinaryIO,
+        original_pdf: str | Path | BinaryIO | bytes | PdfReader,
         output: str | Path | BinaryIO | None = None,
     ) -> bytes | None:
         """
@@ -237,14 +377,26 @@ class PdfMerger:
 
         Legacy method without link annotations.
 
+        .. deprecated::
+            DocumentBuilder now merges with LinkAnnotator.merge_and_add_links,
+            which adds link annotations in the same PyMuPDF pass. Use
+            merge_with_destinations_and_links for a pypdf-only merge.
+
         Args:
-            prepend_bytes: Bytes of the prepended PDF (already generated)
-            original_pdf: Original PDF to append to
+            prepend_bytes: The prepended PDF (already generated), as bytes or a stream
+            original_pdf: Original PDF to append to (may be an already open reader)
             output: Optional output path or stream
 
         Returns:
             PDF bytes if output is None, otherwise None
         """
+        warnings.warn(
+            "PdfMerger.merge_with_destinations is deprecated; use "
+            "LinkAnnotator.merge_and_add_links or "
+            "PdfMerger.merge_with_destinations_and_links instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         return self.merge_with_destinations_and_links(
             prepend_bytes=prepend_bytes,
             original_pdf=original_pdf,
@@ -253,15 +405,187 @@ class PdfMerger:
         )
 
 
+def open_pdf_reader(pdf_source: str | Path | BinaryIO | bytes | PdfReader) -> PdfReader:
+    """
+    Open a PdfReader from various source types.
+
+    Files are memory-mapped rather than read into memory, so only the
+    parts of the original that pypdf actually touches are paged in. The
+    mapping is released together with the reader. To measure and then
+    merge a file with a single parse, pass the same reader to both.
+
+    Args:
+        pdf_source: Path to PDF file, file object, bytes, or an open reader
+
+    Returns:
+        PdfReader instance (the given reader itself if one was passed)
+    """
+    if isinstance(pdf_source, PdfReader):
+        return pdf_source
+    elif isinstance(pdf_source, (bytes, bytearray, memoryview)):
+        return PdfReader(io.BytesIO(_unwrap_buffer(pdf_source)))
+    elif isinstance(pdf_source, (str, Path)):
+        return _open_file_reader(pdf_source)
+    else:
+        return PdfReader(pdf_source)
+
+
+def _open_file_reader(path: str | Path) -> PdfReader:
+    """Open a memory-mapped reader for a file."""
+    with open(path, "rb") as f:
+        try:
+            # The mapping outlives the file object and is released
+            # together with the reader
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped; let pypdf report them
+            return PdfReader(path)
+    return PdfReader(mapped)
+
+
+def _unwrap_buffer(
+    data: bytes | bytearray | memoryview,
+) -> bytes | bytearray | memoryview:
+    """
+    Return the bytes object a memoryview spans in full, if there is one.
+
+    BytesIO shares a bytes object's buffer until it is written to, but
+    copies any other buffer, so passing the underlying bytes instead of a
+    view over them avoids a copy of the whole PDF.
+    """
+    if (
+        isinstance(data, memoryview)
+        and isinstance(data.obj, bytes)
+        and data.c_contiguous
+        and data.nbytes == len(data.obj)
+    ):
+        return data.obj
+    return data
+
+
 def count_pdf_pages(pdf_source: str | Path | BinaryIO | bytes) -> int:
     """
     Convenience function to count pages in a PDF.
 
+    The count is read straight from the page tree root found through the
+    trailer, without parsing the rest of the document. PDFs the scan
+    cannot follow (e.g. cross-reference streams) are parsed with pypdf.
+
     Args:
         pdf_source: Path to PDF file, file object, or bytes
 
     Returns:
         Number of pages in the PDF
     """
-    merger = PdfMerger()
-    return merger.get_page_count(pdf_source)
+    if isinstance(pdf_source, (str, Path)):
+        with open(pdf_source, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    page_count = _scan_page_count(data)
+            except ValueError:
+                # Empty files cannot be mapped; let pypdf report them
+                page_count = None
+    else:
+        if not isinstance(pdf_source, (bytes, bytearray, memoryview)):
+            pdf_source = pdf_source.read()
+        page_count = _scan_page_count(pdf_source)
+
+    if page_count is None:
+        merger = PdfMerger()
+        page_count = merger.get_page_count(pdf_source)
+    return page_count
+
+
+def _scan_page_count(data: bytes | bytearray | memoryview | mmap.mmap) -> int | None:
+    """
+    Read the /Count of the page tree root by following the trailer.
+
+    Only classic cross-reference tables are followed, including incremental
+    updates chained through /Prev.
+
+    Args:
+        data: The complete PDF file contents
+
+    Returns:
+        The page count, or None if the PDF could not be scanned
+    """
+    if isinstance(data, memoryview):
+        # Memoryviews have no find methods
+        data = bytes(_unwrap_buffer(data))
+    startxref = data.rfind(b"startxref")
+    match = _STARTXREF_RE.match(data, startxref) if startxref != -1 else None
+    if match is None:
+        return None
+
+    # Newer sections come first in the /Prev chain, so they take precedence
+    offsets: dict[int, int] = {}
+    root = None
+    xref_offset: int | None = int(match.group(1))
+    visited = set()
+    while xref_offset is not None and xref_offset not in visited:
+        visited.add(xref_offset)
+        trailer = _read_xref_section(data, xref_offset, offsets)
+        if trailer is None:
+            return None
+        if root is None:
+            root_match = _ROOT_RE.search(trailer)
+            root = int(root_match.group(1)) if root_match else None
+        prev_match = _PREV_RE.search(trailer)
+        xref_offset = int(prev_match.group(1)) if prev_match else None
+
+    root_obj = _read_object(data, root, offsets) if root is not None else None
+    pages_match = _PAGES_RE.search(root_obj) if root_obj is not None else None
+    if pages_match is None:
+        return None
+    pages_obj = _read_object(data, int(pages_match.group(1)), offsets)
+    count_match = _COUNT_RE.search(pages_obj) if pages_obj is not None else None
+    return int(count_match.group(1)) if count_match else None
+
+
+def _read_xref_section(
+    data: bytes | bytearray | mmap.mmap, offset: int, offsets: dict[int, int]
+) -> bytes | None:
+    """
+    Record the in-use object offsets of one cross-reference table.
+
+    Offsets already recorded from a newer section are kept.
+
+    Returns:
+        The trailer dictionary following the table, or None if there is
+        no classic table at the offset
+    """
+    if data[offset : offset + 4] != b"xref":
+        return None
+    pos = offset + 4
+    while (subsection := _XREF_SUBSECTION_RE.match(data, pos)) is not None:
+        first, count = int(subsection.group(1)), int(subsection.group(2))
+        pos = subsection.end()
+        for number in range(first, first + count):
+            entry = _XREF_ENTRY_RE.match(data, pos)
+            if entry is None:
+                return None
+            if entry.group(2) == b"n":
+                offsets.setdefault(number, int(entry.group(1)))
+            pos = entry.end()
+
+    trailer_start = data.find(b"trailer", pos)
+    trailer_end = data.find(b"startxref", pos)
+    if trailer_start == -1 or trailer_end < trailer_start:
+        return None
+    return bytes(data[trailer_start:trailer_end])
+
+
+def _read_object(
+    data: bytes | bytearray | mmap.mmap, number: int, offsets: dict[int, int]
+) -> bytes | None:
+    """Return the body of an indirect object, or None if it is not found."""
+    offset = offsets.get(number)
+    if offset is None:
+        return None
+    header = _OBJ_HEADER_RE.match(data, offset)
+    if header is None or int(header.group(1)) != number:
+        return None
+    end = data.find(b"endobj", header.end())
+    if end == -1:
+        return None
+    return bytes(data[header.end() : end])
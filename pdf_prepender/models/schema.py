@@ -3,7 +3,12 @@
 from enum import Enum
 from typing import Annotated, Literal, Union
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# Shared by every model. Models are frozen so that one Defaults instance,
+# _DEFAULT_DEFAULTS below, can be shared by every specification that
+# omits its defaults.
+_MODEL_CONFIG = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
 
 
 class OverflowBehavior(str, Enum):
@@ -43,7 +48,12 @@ class Defaults(BaseModel):
     top_margin: float = Field(default=72.0, alias="topMargin")
     bottom_margin: float = Field(default=72.0, alias="bottomMargin")
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
+
+
+# Specs without their own defaults share one instance rather than
+# validating the constant defaults again; models are frozen, so this is safe
+_DEFAULT_DEFAULTS = Defaults()
 
 
 class PageHeading(BaseModel):
@@ -55,7 +65,7 @@ class PageHeading(BaseModel):
     italic: bool = False
     alignment: Alignment = Alignment.LEFT
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 class LinkableItem(BaseModel):
@@ -64,7 +74,7 @@ class LinkableItem(BaseModel):
     text: str
     target_page: int = Field(alias="targetPage", ge=1)
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 class SectionHeading(BaseModel):
@@ -77,7 +87,7 @@ class SectionHeading(BaseModel):
     italic: bool = False
     alignment: Alignment = Alignment.LEFT
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 class SectionSubheading(BaseModel):
@@ -90,7 +100,7 @@ class SectionSubheading(BaseModel):
     italic: bool = True
     alignment: Alignment = Alignment.LEFT
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 class BulletPoint(BaseModel):
@@ -104,7 +114,7 @@ class BulletPoint(BaseModel):
         default=OverflowBehavior.WRAP, alias="overflowBehavior"
     )
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
     @model_validator(mode="after")
     def validate_content(self) -> "BulletPoint":
@@ -125,7 +135,7 @@ class IndentedBulletPoint(BaseModel):
         default=OverflowBehavior.WRAP, alias="overflowBehavior"
     )
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
     @model_validator(mode="after")
     def validate_content(self) -> "IndentedBulletPoint":
@@ -148,13 +158,21 @@ class Page(BaseModel):
     page_heading: PageHeading | None = Field(default=None, alias="pageHeading")
     content: list[ContentElement] = Field(default_factory=list)
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 class PrependSpecification(BaseModel):
     """Root model for the complete prepend specification."""
 
-    defaults: Defaults = Field(default_factory=Defaults)
+    defaults: Defaults = Field(default=_DEFAULT_DEFAULTS)
     pages: list[Page] = Field(min_length=1)
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
+
+    @field_validator("defaults", mode="before")
+    @classmethod
+    def reuse_default_defaults(cls, value: object) -> object:
+        """Reuse the shared Defaults instance for an empty defaults object."""
+        if isinstance(value, dict) and not value:
+            return _DEFAULT_DEFAULTS
+        return value
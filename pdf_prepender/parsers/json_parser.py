@@ -8,6 +8,15 @@ from pydantic import ValidationError
 
 from pdf_prepender.models.schema import PrependSpecification
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# orjson parses several times faster than the standard library and reads
+# UTF-8 bytes directly; its JSONDecodeError subclasses json.JSONDecodeError
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 class JsonParseError(Exception):
     """Exception raised when JSON parsing fails."""
@@ -36,18 +45,18 @@ def parse_json_file(file_path: str | Path) -> PrependSpecification:
         raise FileNotFoundError(f"JSON file not found: {file_path}")
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return parse_json_stream(f)
+        data = _loads(path.read_bytes())
     except json.JSONDecodeError as e:
         raise JsonParseError(f"Invalid JSON syntax: {e}")
+    return parse_json_dict(data)
 
 
-def parse_json_stream(stream: IO[str]) -> PrependSpecification:
+def parse_json_stream(stream: IO[str] | IO[bytes]) -> PrependSpecification:
     """
     Parse a JSON stream into a PrependSpecification.
 
     Args:
-        stream: A file-like object containing JSON data
+        stream: A text or binary file-like object containing JSON data
 
     Returns:
         Validated PrependSpecification model
@@ -56,18 +65,18 @@ def parse_json_stream(stream: IO[str]) -> PrependSpecification:
         JsonParseError: If the JSON is invalid or doesn't match the schema
     """
     try:
-        data = json.load(stream)
+        data = _loads(stream.read())
         return parse_json_dict(data)
     except json.JSONDecodeError as e:
         raise JsonParseError(f"Invalid JSON syntax: {e}")
 
 
-def parse_json_string(json_string: str) -> PrependSpecification:
+def parse_json_string(json_string: str | bytes) -> PrependSpecification:
     """
     Parse a JSON string into a PrependSpecification.
 
     Args:
-        json_string: A string containing JSON data
+        json_string: A string, or UTF-8 bytes, containing JSON data
 
     Returns:
         Validated PrependSpecification model
@@ -76,7 +85,7 @@ def parse_json_string(json_string: str) -> PrependSpecification:
         JsonParseError: If the JSON is invalid or doesn't match the schema
     """
     try:
-        data = json.loads(json_string)
+        data = _loads(json_string)
         return parse_json_dict(data)
     except json.JSONDecodeError as e:
         raise JsonParseError(f"Invalid JSON syntax: {e}")
@@ -1,9 +1,65 @@
 """Text formatter for processing bold/italic markers and XML escaping."""
 
 import re
+from functools import lru_cache
 from html import escape as html_escape
 
 
+@lru_cache(maxsize=32)
+def _compile_marker_patterns(
+    bold_marker: str, italic_marker: str
+) -> tuple[re.Pattern[str], re.Pattern[str]]:
+    """Compile the bold and italic patterns for a pair of markers."""
+    # Escape special regex characters in markers
+    bold_escaped = re.escape(bold_marker)
+    italic_escaped = re.escape(italic_marker)
+
+    # Pattern for bold: **text** -> <b>text</b>
+    # Non-greedy match to handle multiple bold sections
+    bold_pattern = re.compile(rf"{bold_escaped}(.+?){bold_escaped}")
+
+    # Pattern for italic: _text_ -> <i>text</i>
+    # Non-greedy match to handle multiple italic sections
+    italic_pattern = re.compile(rf"{italic_escaped}(.+?){italic_escaped}")
+
+    return bold_pattern, italic_pattern
+
+
+def _escape_xml(text: str) -> str:
+    """Escape XML special characters, shared by escape_xml and _make_link."""
+    # Most text has nothing to escape; hand it back as is
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
+    return html_escape(text, quote=False)
+
+
+@lru_cache(maxsize=4096)
+def _make_link(text: str, destination: str, styled_only: bool) -> str:
+    """
+    Build link markup, shared across formatters for repeated links.
+
+    Args:
+        text: The display text for the link
+        destination: The internal destination (e.g., "page_5")
+        styled_only: If True, return styled text without actual link markup
+
+    Returns:
+        Styled text indicating a link
+    """
+    # Escape the text for XML safety
+    escaped_text = _escape_xml(text)
+    if styled_only:
+        # Return blue underlined text that looks like a link
+        # The actual PDF link annotation will be added after merging
+        return f'<font color="blue"><u>{escaped_text}</u></font>'
+    # Use actual ReportLab link syntax (requires destination to exist)
+    return f'<a href="#{destination}" color="blue">{escaped_text}</a>'
+
+
+# Formatted texts remembered per formatter before the memo starts over
+_FORMAT_CACHE_SIZE = 4096
+
+
 class TextFormatter:
     """Handles conversion of text markers to ReportLab XML tags."""
 
@@ -15,27 +71,37 @@ class TextFormatter:
             bold_marker: The marker used to denote bold text (e.g., "**")
             italic_marker: The marker used to denote italic text (e.g., "_")
         """
-        self.bold_marker = bold_marker
-        self.italic_marker = italic_marker
+        self._bold_marker = bold_marker
+        self._italic_marker = italic_marker
         self._compile_patterns()
 
-    def _compile_patterns(self) -> None:
-        """Compile regex patterns for the markers."""
-        # Escape special regex characters in markers
-        bold_escaped = re.escape(self.bold_marker)
-        italic_escaped = re.escape(self.italic_marker)
-
-        # Pattern for bold: **text** -> <b>text</b>
-        # Non-greedy match to handle multiple bold sections
-        self._bold_pattern = re.compile(
-            rf"{bold_escaped}(.+?){bold_escaped}"
-        )
+    @property
+    def bold_marker(self) -> str:
+        """The marker used to denote bold text."""
+        return self._bold_marker
+
+    @bold_marker.setter
+    def bold_marker(self, marker: str) -> None:
+        self._bold_marker = marker
+        self._compile_patterns()
 
-        # Pattern for italic: _text_ -> <i>text</i>
-        # Non-greedy match to handle multiple italic sections
-        self._italic_pattern = re.compile(
-            rf"{italic_escaped}(.+?){italic_escaped}"
+    @property
+    def italic_marker(self) -> str:
+        """The marker used to denote italic text."""
+        return self._italic_marker
+
+    @italic_marker.setter
+    def italic_marker(self, marker: str) -> None:
+        self._italic_marker = marker
+        self._compile_patterns()
+
+    def _compile_patterns(self) -> None:
+        """Look up the compiled regex patterns for the markers."""
+        self._bold_pattern, self._italic_pattern = _compile_marker_patterns(
+            self._bold_marker, self._italic_marker
         )
+        # Results formatted with other markers no longer apply
+        self._format_cache: dict[tuple[str, bool, bool, bool], str] = {}
 
     def escape_xml(self, text: str) -> str:
         """
@@ -47,7 +113,7 @@ class TextFormatter:
         Returns:
             Text with XML special characters escaped
         """
-        return html_escape(text, quote=False)
+        return _escape_xml(text)
 
     def format_text(
         self,
@@ -68,86 +134,83 @@ class TextFormatter:
         Returns:
             Formatted text with ReportLab XML tags
         """
-        result = text
-
-        if escape_first:
-            # We need to preserve markers during escaping, so we temporarily
-            # replace them with placeholders
-            bold_placeholder = "\x00BOLD\x00"
-            italic_placeholder = "\x00ITALIC\x00"
-
-            # Find all bold sections and replace markers with placeholders
-            bold_matches = list(self._bold_pattern.finditer(result))
-            for match in reversed(bold_matches):
-                inner_text = self.escape_xml(match.group(1))
-                result = (
-                    result[: match.start()]
-                    + f"{bold_placeholder}{inner_text}{bold_placeholder}"
-                    + result[match.end() :]
-                )
-
-            # Find all italic sections and replace markers with placeholders
-            italic_matches = list(self._italic_pattern.finditer(result))
-            for match in reversed(italic_matches):
-                inner_text = self.escape_xml(match.group(1))
-                result = (
-                    result[: match.start()]
-                    + f"{italic_placeholder}{inner_text}{italic_placeholder}"
-                    + result[match.end() :]
-                )
-
-            # Escape remaining text (outside markers)
-            # Split by placeholders and escape parts that aren't inside markers
-            parts = re.split(
-                rf"({re.escape(bold_placeholder)}|{re.escape(italic_placeholder)})",
-                result,
+        if self._bold_marker not in text and self._italic_marker not in text:
+            # Nothing to convert; most text has no markers at all
+            return self.escape_xml(text) if escape_first else text
+
+        # Labels such as "**Note:**" repeat across pages, so marked-up
+        # text is formatted once per formatter
+        key = (text, escape_first, apply_bold, apply_italic)
+        result = self._format_cache.get(key)
+        if result is None:
+            if len(self._format_cache) >= _FORMAT_CACHE_SIZE:
+                self._format_cache.clear()
+            result = self._format_cache[key] = self._format_markers(
+                text, escape_first, apply_bold, apply_italic
             )
-            in_bold = False
-            in_italic = False
-            escaped_parts = []
-
-            for part in parts:
-                if part == bold_placeholder:
-                    in_bold = not in_bold
-                    escaped_parts.append(part)
-                elif part == italic_placeholder:
-                    in_italic = not in_italic
-                    escaped_parts.append(part)
-                elif in_bold or in_italic:
-                    # Already escaped above
-                    escaped_parts.append(part)
-                else:
-                    escaped_parts.append(self.escape_xml(part))
-
-            result = "".join(escaped_parts)
-
-            # Convert placeholders to XML tags
-            if apply_bold:
-                result = result.replace(bold_placeholder, "<b>", 1)
-                while bold_placeholder in result:
-                    result = result.replace(bold_placeholder, "</b>", 1)
-                    if bold_placeholder in result:
-                        result = result.replace(bold_placeholder, "<b>", 1)
-            else:
-                result = result.replace(bold_placeholder, "")
+        return result
 
-            if apply_italic:
-                result = result.replace(italic_placeholder, "<i>", 1)
-                while italic_placeholder in result:
-                    result = result.replace(italic_placeholder, "</i>", 1)
-                    if italic_placeholder in result:
-                        result = result.replace(italic_placeholder, "<i>", 1)
-            else:
-                result = result.replace(italic_placeholder, "")
-
-        else:
+    def _format_markers(
+        self, text: str, escape_first: bool, apply_bold: bool, apply_italic: bool
+    ) -> str:
+        """Convert the markers in text to tags; see format_text."""
+        if not escape_first:
             # No escaping, just replace markers with tags
+            result = text
             if apply_bold:
                 result = self._bold_pattern.sub(r"<b>\1</b>", result)
             if apply_italic:
                 result = self._italic_pattern.sub(r"<i>\1</i>", result)
-
-        return result
+            return result
+
+        # Collect each marker as (position, length, tag) in the original
+        # text, then escape the runs between markers in a single pass.
+        # Every run is escaped exactly once, so text inside an italic
+        # section that also holds a bold one is no longer escaped twice.
+        events = []
+        bold_length = len(self._bold_marker)
+        bold_open, bold_close = ("<b>", "</b>") if apply_bold else ("", "")
+        # Italic sections are matched with the bold markers masked out,
+        # keeping positions aligned with the original text
+        mask = "\x00" * bold_length
+        masked_parts = []
+        position = 0
+        # A marker that occurs at most once cannot pair, so its pattern
+        # is only run when the text could contain a section
+        if text.count(self._bold_marker) > 1:
+            for match in self._bold_pattern.finditer(text):
+                start, end = match.span()
+                events.append((start, bold_length, bold_open))
+                events.append((end - bold_length, bold_length, bold_close))
+                masked_parts.extend(
+                    (text[position:start], mask, match.group(1), mask)
+                )
+                position = end
+        masked = text
+        if masked_parts:
+            masked_parts.append(text[position:])
+            masked = "".join(masked_parts)
+
+        italic_length = len(self._italic_marker)
+        italic_open, italic_close = ("<i>", "</i>") if apply_italic else ("", "")
+        if masked.count(self._italic_marker) > 1:
+            for match in self._italic_pattern.finditer(masked):
+                events.append((match.start(), italic_length, italic_open))
+                events.append(
+                    (match.end() - italic_length, italic_length, italic_close)
+                )
+        if not events:
+            return self.escape_xml(text)
+        events.sort()
+
+        parts = []
+        position = 0
+        for start, length, tag in events:
+            parts.append(self.escape_xml(text[position:start]))
+            parts.append(tag)
+            position = start + length
+        parts.append(self.escape_xml(text[position:]))
+        return "".join(parts)
 
     def apply_style(self, text: str, bold: bool = False, italic: bool = False) -> str:
         """
@@ -161,12 +224,10 @@ class TextFormatter:
         Returns:
             Text wrapped in appropriate tags
         """
-        result = text
+        # One f-string per shape; italic wraps bold when both are set
         if bold:
-            result = f"<b>{result}</b>"
-        if italic:
-            result = f"<i>{result}</i>"
-        return result
+            return f"<i><b>{text}</b></i>" if italic else f"<b>{text}</b>"
+        return f"<i>{text}</i>" if italic else text
 
     def create_link(self, text: str, destination: str, styled_only: bool = True) -> str:
         """
@@ -184,12 +245,4 @@ class TextFormatter:
         Returns:
             Styled text indicating a link
         """
-        # Escape the text for XML safety
-        escaped_text = self.escape_xml(text)
-        if styled_only:
-            # Return blue underlined text that looks like a link
-            # The actual PDF link annotation will be added after merging
-            return f'<font color="blue"><u>{escaped_text}</u></font>'
-        else:
-            # Use actual ReportLab link syntax (requires destination to exist)
-            return f'<a href="#{destination}" color="blue">{escaped_text}</a>'
+        return _make_link(text, destination, styled_only)
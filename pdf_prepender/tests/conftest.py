@@ -8,9 +8,13 @@ from reportlab.lib.pagesizes import LETTER
 from reportlab.pdfgen import canvas
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf_bytes() -> bytes:
-    """Create a simple multi-page PDF for testing."""
+    """Create a simple multi-page PDF for testing.
+
+    Built once per session; bytes are immutable, so tests cannot affect
+    each other through it.
+    """
     buffer = io.BytesIO()
     c = canvas.Canvas(buffer, pagesize=LETTER)
 
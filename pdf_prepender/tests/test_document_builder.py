@@ -1,12 +1,19 @@
 """Tests for the document builder module."""
 
 import io
+import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 
+import fitz
 import pytest
+from pydantic import ValidationError
 from pypdf import PdfReader
 
 from pdf_prepender.core.document_builder import DocumentBuilder, prepend_pages
+from pdf_prepender.models.schema import Alignment
 from pdf_prepender.parsers.json_parser import JsonParseError
 
 
@@ -21,28 +28,105 @@ class TestDocumentBuilder:
 
     def test_from_json_string(self, simple_spec_dict: dict):
         """Test creating builder from JSON string."""
-        import json
-
         json_str = json.dumps(simple_spec_dict)
         builder = DocumentBuilder.from_json_string(json_str)
         assert builder.spec is not None
 
     def test_from_json_file(self, tmp_path: Path, simple_spec_dict: dict):
         """Test creating builder from JSON file."""
-        import json
-
         json_path = tmp_path / "spec.json"
         json_path.write_text(json.dumps(simple_spec_dict))
 
         builder = DocumentBuilder.from_json_file(json_path)
         assert builder.spec is not None
 
+    def test_from_json_file_specs_are_independent(
+        self, tmp_path: Path, simple_spec_dict: dict
+    ):
+        """Test that builders from the same file do not share a specification."""
+        json_path = tmp_path / "spec.json"
+        json_path.write_text(json.dumps(simple_spec_dict))
+
+        first = DocumentBuilder.from_json_file(json_path)
+        first.spec.pages.append(first.spec.pages[0])
+        second = DocumentBuilder.from_json_file(json_path)
+        assert second.spec is not first.spec
+        assert len(second.spec.pages) == 1
+
+    def test_parsed_spec_is_frozen(self, simple_spec_dict: dict):
+        """Test that parsed specifications cannot be reassigned."""
+        spec = DocumentBuilder.from_dict(simple_spec_dict).spec
+        with pytest.raises(ValidationError):
+            spec.pages = []
+
+    def test_specs_without_defaults_share_them(self, simple_spec_dict: dict):
+        """Test that missing or empty defaults reuse one Defaults instance."""
+        spec_dict = dict(simple_spec_dict)
+        spec_dict.pop("defaults", None)
+        first = DocumentBuilder.from_dict(spec_dict).spec
+        second = DocumentBuilder.from_dict({**spec_dict, "defaults": {}}).spec
+        assert first.defaults is second.defaults
+        assert first.defaults.font_size == 11
+
+    def test_from_dict_specs_are_independent(self, simple_spec_dict: dict):
+        """Test that builders from equal inputs do not share a specification."""
+        first = DocumentBuilder.from_dict(simple_spec_dict)
+        first.spec.pages.append(first.spec.pages[0])
+        second = DocumentBuilder.from_dict(simple_spec_dict)
+        assert second.spec is not first.spec
+        assert len(second.spec.pages) == 1
+
+        json_str = json.dumps(simple_spec_dict)
+        first = DocumentBuilder.from_json_string(json_str)
+        first.spec.pages.append(first.spec.pages[0])
+        assert len(DocumentBuilder.from_json_string(json_str).spec.pages) == 1
+
+    def test_from_dict_with_non_json_values(self):
+        """Test that dictionaries holding model values are still parsed."""
+        heading = {"text": "Contents", "alignment": Alignment.CENTER}
+        spec_dict = {"pages": [{"pageHeading": heading}]}
+        builder = DocumentBuilder.from_dict(spec_dict)
+        assert builder.spec.pages[0].page_heading.alignment == Alignment.CENTER
+
+    def test_from_dict_accepts_specification(self, simple_spec_dict: dict):
+        """Test creating builder from an already parsed specification."""
+        spec = DocumentBuilder.from_dict(simple_spec_dict).spec
+        builder = DocumentBuilder.from_dict(spec)
+        assert builder.spec is spec
+
+    def test_import_does_not_load_pymupdf(self):
+        """Test that importing the builder leaves PyMuPDF unloaded."""
+        code = (
+            "import sys; import pdf_prepender.core.document_builder; "
+            "print('pymupdf' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parents[2],
+        )
+        assert result.stdout.strip() == "False"
+
     def test_get_prepend_page_count(self, simple_spec_dict: dict):
         """Test counting prepended pages."""
         builder = DocumentBuilder.from_dict(simple_spec_dict)
         count = builder.get_prepend_page_count()
         assert count >= 1
 
+    def test_prepend_page_count_cached_until_spec_replaced(
+        self, simple_spec_dict: dict, multi_page_spec_dict: dict
+    ):
+        """Test that the page count is reused until the spec changes."""
+        builder = DocumentBuilder.from_dict(simple_spec_dict)
+        assert builder.get_prepend_page_count() == 1
+        assert builder._cached_page_count == 1
+
+        builder.spec = DocumentBuilder.from_dict(multi_page_spec_dict).spec
+        assert builder._cached_page_count is None
+        assert builder.get_prepend_page_count() == 2
+
     def test_build_returns_bytes(
         self, simple_spec_dict: dict, sample_pdf_bytes: bytes
     ):
@@ -64,6 +148,48 @@ class TestDocumentBuilder:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
+    def test_build_to_file_appends_incremental_update(
+        self, sample_pdf_path: Path, tmp_path: Path
+    ):
+        """Test that link-free path-to-path builds keep the original bytes."""
+        spec_dict = {
+            "pages": [
+                {
+                    "pageHeading": {"text": "Summary"},
+                    "content": [{"type": "sectionHeading", "text": "Notes"}],
+                }
+            ]
+        }
+        builder = DocumentBuilder.from_dict(spec_dict)
+        output_path = tmp_path / "output.pdf"
+        builder.build_to_file(sample_pdf_path, output_path)
+
+        assert output_path.read_bytes().startswith(sample_pdf_path.read_bytes())
+        reader = PdfReader(output_path)
+        assert len(reader.pages) == 11
+        assert "page_11" in reader.named_destinations
+
+        # New files get the usual permissions, existing ones keep theirs
+        umask = os.umask(0)
+        os.umask(umask)
+        assert output_path.stat().st_mode & 0o777 == 0o666 & ~umask
+        output_path.chmod(0o640)
+        builder.build_to_file(sample_pdf_path, output_path)
+        assert output_path.stat().st_mode & 0o777 == 0o640
+
+    def test_build_to_file_with_links_is_rewritten(
+        self, simple_spec_dict: dict, sample_pdf_path: Path, tmp_path: Path
+    ):
+        """Test that builds with links write a single-revision merge."""
+        builder = DocumentBuilder.from_dict(simple_spec_dict)
+        output_path = tmp_path / "output.pdf"
+        builder.build_to_file(sample_pdf_path, output_path)
+
+        assert not output_path.read_bytes().startswith(sample_pdf_path.read_bytes())
+        with fitz.open(output_path) as doc:
+            assert len(doc) == 11
+            assert [link["page"] for link in doc[0].get_links()] == [5, 8]
+
     def test_build_with_stream_output(
         self, simple_spec_dict: dict, sample_pdf_bytes: bytes
     ):
@@ -77,6 +203,51 @@ class TestDocumentBuilder:
         content = output_stream.read()
         assert content.startswith(b"%PDF")
 
+    def test_build_without_pages_returns_original(
+        self, simple_spec_dict: dict, sample_pdf_bytes: bytes
+    ):
+        """Test that a spec with no pages passes the original through."""
+        builder = DocumentBuilder.from_dict(simple_spec_dict)
+        builder.spec = builder.spec.model_copy(update={"pages": []})
+
+        assert builder.build(sample_pdf_bytes) == sample_pdf_bytes
+        assert builder.get_prepend_page_count() == 0
+
+    def test_build_many(
+        self, multi_page_spec_dict: dict, sample_pdf_bytes: bytes, tmp_path: Path
+    ):
+        """Test prepending the same pages to several PDFs."""
+        builder = DocumentBuilder.from_dict(multi_page_spec_dict)
+        output_path = tmp_path / "output.pdf"
+        results = builder.build_many(
+            [sample_pdf_bytes, sample_pdf_bytes], [None, output_path]
+        )
+
+        assert results[1] is None
+        for pdf in (results[0], output_path.read_bytes()):
+            reader = PdfReader(io.BytesIO(pdf))
+            assert len(reader.pages) == 12
+        assert builder.link_manager.prepended_page_count == 2
+
+    def test_build_many_rejects_mismatched_outputs(
+        self, simple_spec_dict: dict, sample_pdf_bytes: bytes
+    ):
+        """Test that outputs must match originals one to one."""
+        builder = DocumentBuilder.from_dict(simple_spec_dict)
+        with pytest.raises(ValueError):
+            builder.build_many([sample_pdf_bytes], [None, None])
+
+    def test_build_with_buffer_originals(
+        self, simple_spec_dict: dict, sample_pdf_bytes: bytes
+    ):
+        """Test building from bytearray and memoryview originals."""
+        builder = DocumentBuilder.from_dict(simple_spec_dict)
+        buffer = bytearray(sample_pdf_bytes)
+
+        for original in (buffer, memoryview(buffer)):
+            reader = PdfReader(io.BytesIO(builder.build(original)))
+            assert len(reader.pages) == 11
+
     def test_prepended_pages_come_first(
         self, simple_spec_dict: dict, sample_pdf_bytes: bytes
     ):
@@ -128,8 +299,6 @@ class TestPrependPagesFunction:
 
     def test_with_json_string(self, simple_spec_dict: dict, sample_pdf_bytes: bytes):
         """Test prepend_pages with JSON string."""
-        import json
-
         json_str = json.dumps(simple_spec_dict)
         result = prepend_pages(json_str, sample_pdf_bytes)
         assert result is not None
@@ -139,8 +308,6 @@ class TestPrependPagesFunction:
         self, tmp_path: Path, simple_spec_dict: dict, sample_pdf_path: Path
     ):
         """Test prepend_pages with JSON file path."""
-        import json
-
         json_path = tmp_path / "spec.json"
         json_path.write_text(json.dumps(simple_spec_dict))
 
@@ -207,3 +374,21 @@ class TestLinkOffsetCalculation:
         assert prepend_count == 2
         assert builder.link_manager.get_adjusted_page(5) == 7
         assert builder.link_manager.get_adjusted_page(7) == 9
+
+    def test_link_annotations_target_adjusted_pages(
+        self, multi_page_spec_dict: dict, sample_pdf_bytes: bytes
+    ):
+        """Test that link annotations point past the prepended pages."""
+        builder = DocumentBuilder.from_dict(multi_page_spec_dict)
+        result = builder.build(sample_pdf_bytes)
+
+        doc = fitz.open(stream=result, filetype="pdf")
+        try:
+            # Link targets are 0-based; 2 pages are prepended
+            first_page_targets = [link["page"] for link in doc[0].get_links()]
+            second_page_targets = [link["page"] for link in doc[1].get_links()]
+        finally:
+            doc.close()
+
+        assert first_page_targets == [4]
+        assert sorted(second_page_targets) == [6, 8]
@@ -0,0 +1,130 @@
+"""Tests for the link annotator module."""
+
+import io
+from pathlib import Path
+
+import fitz
+import pytest
+
+from pdf_prepender.core.link_annotator import LinkAnnotator, add_links_to_pdf
+from pdf_prepender.core.page_generator import LinkPosition
+
+
+class TestAddLinks:
+    """Tests for adding link annotations."""
+
+    def test_links_point_to_target_pages(self, sample_pdf_bytes: bytes):
+        """Test that links are added on their page with the offset applied."""
+        link_positions = [
+            LinkPosition(0, 2, "Page 1", 100, 400, 50, 20),
+            LinkPosition(0, 4, "", 100, 300, 50, 20),
+            LinkPosition(1, 5, "Page 2", 100, 400, 50, 20),
+        ]
+        result = add_links_to_pdf(sample_pdf_bytes, link_positions, page_offset=1)
+
+        with fitz.open(stream=result, filetype="pdf") as doc:
+            assert [link["page"] for link in doc[0].get_links()] == [2, 4]
+            assert [link["page"] for link in doc[1].get_links()] == [5]
+            assert doc[0].get_links()[0]["to"] == fitz.Point(0, 0)
+
+    def test_existing_annotations_are_kept(self, sample_pdf_bytes: bytes):
+        """Test that links are appended to a page's existing annotations."""
+        with fitz.open(stream=sample_pdf_bytes, filetype="pdf") as doc:
+            doc[0].insert_link(
+                {"kind": fitz.LINK_GOTO, "from": fitz.Rect(0, 0, 10, 10), "page": 9}
+            )
+            pdf_bytes = doc.tobytes()
+
+        link_positions = [LinkPosition(0, 3, "Page 1", 100, 400, 50, 20)]
+        result = add_links_to_pdf(pdf_bytes, link_positions)
+
+        with fitz.open(stream=result, filetype="pdf") as doc:
+            assert [link["page"] for link in doc[0].get_links()] == [9, 2]
+
+    def test_links_appended_in_place(self, sample_pdf_path: Path):
+        """Test that links are appended to the source file incrementally."""
+        original = sample_pdf_path.read_bytes()
+        link_positions = [LinkPosition(0, 3, "Page 1", 100, 400, 50, 20)]
+
+        result = add_links_to_pdf(
+            None, link_positions, output=sample_pdf_path, source_path=sample_pdf_path
+        )
+
+        assert result is None
+        updated = sample_pdf_path.read_bytes()
+        assert updated.startswith(original)
+        with fitz.open(sample_pdf_path) as doc:
+            assert [link["page"] for link in doc[0].get_links()] == [2]
+
+    def test_given_bytes_written_over_source_path(
+        self, sample_pdf_path: Path, sample_pdf_bytes: bytes
+    ):
+        """Test that pdf_bytes are not ignored when output is the source file."""
+        with fitz.open(stream=sample_pdf_bytes, filetype="pdf") as doc:
+            doc.select([0, 1, 2])
+            pdf_bytes = doc.tobytes()
+        link_positions = [LinkPosition(0, 2, "Page 1", 100, 400, 50, 20)]
+
+        for positions, expected_links in ((link_positions, [1]), ([], [])):
+            result = add_links_to_pdf(
+                pdf_bytes, positions, output=sample_pdf_path, source_path=sample_pdf_path
+            )
+
+            assert result is None
+            with fitz.open(sample_pdf_path) as doc:
+                assert doc.page_count == 3
+                assert [link["page"] for link in doc[0].get_links()] == expected_links
+
+    def test_links_with_same_text_get_distinct_rects(self):
+        """Test that repeated link texts on a page are matched one to one."""
+        with fitz.open() as doc:
+            page = doc.new_page(width=612, height=792)
+            page.insert_text((72, 100), "See also")
+            page.insert_text((72, 300), "See also")
+            doc.new_page()
+            doc.new_page()
+            pdf_bytes = doc.tobytes()
+
+        # Both estimates lie nearest the upper occurrence
+        link_positions = [
+            LinkPosition(0, 2, "See also", 72, 700, 50, 12),
+            LinkPosition(0, 3, "See also", 72, 690, 50, 12),
+        ]
+        result = add_links_to_pdf(pdf_bytes, link_positions)
+
+        with fitz.open(stream=result, filetype="pdf") as doc:
+            rects = [link["from"] for link in doc[0].get_links()]
+        assert len(rects) == 2
+        assert rects[0].y1 < 150 < rects[1].y1
+
+    def test_no_links_passes_pdf_through(self, sample_pdf_bytes: bytes):
+        """Test that a PDF without links is copied unchanged."""
+        output = io.BytesIO()
+        result = add_links_to_pdf(io.BytesIO(sample_pdf_bytes), [], output=output)
+
+        assert result is None
+        assert output.getvalue() == sample_pdf_bytes
+
+
+class TestMergeAndAddLinks:
+    """Tests for merging path inputs into path outputs."""
+
+    def test_unreadable_original_keeps_output(
+        self, sample_pdf_bytes: bytes, tmp_path: Path
+    ):
+        """Test that a failed merge leaves an existing output untouched."""
+        original_path = tmp_path / "broken.pdf"
+        original_path.write_bytes(b"not a pdf")
+        output_path = tmp_path / "output.pdf"
+        output_path.write_bytes(b"previous output")
+
+        with pytest.raises(fitz.FileDataError):
+            LinkAnnotator().merge_and_add_links(
+                sample_pdf_bytes, original_path, [], output=output_path
+            )
+
+        assert output_path.read_bytes() == b"previous output"
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "broken.pdf",
+            "output.pdf",
+        ]
@@ -1,5 +1,7 @@
 """Tests for the link manager module."""
 
+import dataclasses
+
 import pytest
 
 from pdf_prepender.core.link_manager import LinkInfo, LinkManager
@@ -24,6 +26,20 @@ class TestLinkInfo:
         assert link.original_page == 10
         assert link.adjusted_page is None
 
+    def test_dataclass_api(self):
+        """Test that managed links work with the dataclass helpers."""
+        manager = LinkManager()
+        link = manager.register_link(3)
+        manager.set_prepended_page_count(2)
+
+        assert [f.name for f in dataclasses.fields(link)] == [
+            "original_page",
+            "adjusted_page",
+        ]
+        assert dataclasses.asdict(link) == {"original_page": 3, "adjusted_page": 5}
+        assert dataclasses.replace(link, original_page=4) == LinkInfo(4, 5)
+        assert repr(link) == "LinkInfo(original_page=3, adjusted_page=5)"
+
 
 class TestLinkManager:
     """Tests for LinkManager class."""
@@ -62,6 +78,34 @@ class TestLinkManager:
         manager.set_prepended_page_count(3)
         assert link.adjusted_page == 8
 
+    def test_links_follow_later_count_changes(self):
+        """Test that registered links track every change of the count."""
+        manager = LinkManager()
+        link = manager.register_link(5)
+        assert link.adjusted_page == 5
+        manager.set_prepended_page_count(3)
+        late_link = manager.register_link(2)
+        manager.set_prepended_page_count(4)
+        assert (link.adjusted_page, late_link.adjusted_page) == (9, 6)
+        assert link == LinkInfo(original_page=5, adjusted_page=9)
+
+        link.adjusted_page = 1
+        manager.set_prepended_page_count(6)
+        assert link.adjusted_page == 1
+
+    def test_links_follow_count_set_directly(self):
+        """Test that links agree with get_adjusted_page however the count is set."""
+        manager = LinkManager(prepended_page_count=5)
+        link = manager.register_link(2)
+        assert link.adjusted_page == manager.get_adjusted_page(2) == 7
+
+        manager.prepended_page_count = 1
+        assert link.adjusted_page == manager.get_adjusted_page(2) == 3
+        assert [f.name for f in dataclasses.fields(LinkManager)] == [
+            "prepended_page_count",
+            "_links",
+        ]
+
     def test_get_adjusted_page(self):
         """Test getting adjusted page number."""
         manager = LinkManager()
@@ -87,6 +131,14 @@ class TestLinkManager:
         manager = LinkManager()
         assert manager.get_destination_name(5) == "page_5"
 
+    def test_get_destination_name_after_count_change(self):
+        """Test destination names follow a changed page count."""
+        manager = LinkManager()
+        manager.set_prepended_page_count(2)
+        assert manager.get_destination_name(5) == "page_7"
+        manager.set_prepended_page_count(4)
+        assert manager.get_destination_name(5) == "page_9"
+
     def test_clear(self):
         """Test clearing registered links."""
         manager = LinkManager()
@@ -101,6 +153,25 @@ class TestLinkManager:
         manager = LinkManager()
         destinations = manager.generate_all_destinations(5)
         assert destinations == ["page_1", "page_2", "page_3", "page_4", "page_5"]
+        destinations.append("extra")
+        assert manager.generate_all_destinations(5) == destinations[:5]
+        assert manager.generate_all_destinations(2) == ["page_1", "page_2"]
+
+    def test_destination_names_shared_between_managers(self):
+        """Test that managers hand out the same cached name strings."""
+        names = LinkManager().generate_all_destinations(3)
+        assert LinkManager().get_destination_name(3) is names[2]
+        assert LinkInfo(original_page=3).destination_name is names[2]
+        assert LinkInfo(original_page=-1).destination_name == "page_-1"
+
+    def test_destination_names_beyond_shared_table(self):
+        """Test that names past the shared table are formatted on demand."""
+        manager = LinkManager()
+        assert manager.get_destination_name(5_000_000) == "page_5000000"
+        destinations = manager.generate_all_destinations(1500)
+        assert len(destinations) == 1500
+        assert destinations[1023:1025] == ["page_1024", "page_1025"]
+        assert destinations[-1] == "page_1500"
 
     def test_generate_all_destinations_empty(self):
         """Test generating destinations for zero pages."""
@@ -0,0 +1,91 @@
+"""Tests for the page generator module."""
+
+import pytest
+
+from pdf_prepender.core.page_generator import PageGenerator
+from pdf_prepender.models.schema import PrependSpecification
+
+
+def _filler_bullets(count: int, words: int = 30) -> list[dict]:
+    """Build plain bullet points long enough to wrap over several lines."""
+    return [
+        {
+            "type": "bulletPoint",
+            "label": f"Item {i}:",
+            "content": [" ".join(["filler"] * words)],
+        }
+        for i in range(count)
+    ]
+
+
+ONE_PAGE_SPEC = {
+    "pages": [
+        {
+            "pageHeading": {"text": "Document Summary", "bold": True},
+            "content": [
+                {"type": "sectionHeading", "text": "Key References"},
+                {
+                    "type": "bulletPoint",
+                    "label": "**Lab Results:**",
+                    "content": [{"text": "Blood Panel", "targetPage": 5}],
+                },
+            ],
+        }
+    ],
+}
+
+OVERFLOW_SPEC = {
+    "pages": [
+        {
+            "pageHeading": {"text": "Long Summary"},
+            "content": [
+                {"type": "sectionHeading", "text": "Findings"},
+                *_filler_bullets(60),
+                {
+                    "type": "bulletPoint",
+                    "label": "See:",
+                    "content": [{"text": "Results", "targetPage": 2}],
+                },
+            ],
+        }
+    ],
+}
+
+KEEP_TOGETHER_SPEC = {
+    "pages": [
+        {
+            "pageHeading": {"text": "Grouped Summary"},
+            "content": [
+                *_filler_bullets(17),
+                {"type": "sectionHeading", "text": "Kept Together"},
+                {
+                    "type": "bulletPoint",
+                    "label": "Details:",
+                    "content": [
+                        " ".join(["detail"] * 60),
+                        {"text": "Appendix", "targetPage": 4},
+                    ],
+                    "overflowBehavior": "wrapWithPageBreak",
+                },
+            ],
+        }
+    ],
+}
+
+
+class TestPageGenerator:
+    """Tests for PageGenerator class."""
+
+    @pytest.mark.parametrize(
+        ("spec_dict", "expected_pages"),
+        [(ONE_PAGE_SPEC, 1), (OVERFLOW_SPEC, 3), (KEEP_TOGETHER_SPEC, 2)],
+        ids=["one_page", "overflow", "keep_together"],
+    )
+    def test_plan_matches_generate(self, spec_dict: dict, expected_pages: int):
+        """Test that the layout-only pass counts the same pages as rendering."""
+        spec = PrependSpecification.model_validate(spec_dict)
+        generator = PageGenerator(spec)
+
+        planned = generator.plan()
+        assert generator.link_positions == []
+        assert planned == generator.generate()[1] == expected_pages
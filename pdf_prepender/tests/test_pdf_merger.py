@@ -0,0 +1,209 @@
+"""Tests for the PDF merger module."""
+
+import io
+import shutil
+from pathlib import Path
+
+import fitz
+import pytest
+from pypdf import PdfReader
+
+from pdf_prepender.core.pdf_merger import (
+    PdfMerger,
+    _scan_page_count,
+    _unwrap_buffer,
+    count_pdf_pages,
+    open_pdf_reader,
+)
+from pdf_prepender.core.page_generator import LinkPosition
+
+
+class TestCountPdfPages:
+    """Tests for count_pdf_pages."""
+
+    def test_count_from_bytes_and_path(
+        self, sample_pdf_bytes: bytes, sample_pdf_path: Path
+    ):
+        """Test counting pages of in-memory and on-disk PDFs."""
+        assert _scan_page_count(sample_pdf_bytes) == 10
+        assert count_pdf_pages(sample_pdf_bytes) == 10
+        assert count_pdf_pages(sample_pdf_path) == 10
+
+    def test_count_follows_incremental_updates(
+        self, sample_pdf_path: Path, tmp_path: Path
+    ):
+        """Test that pages added in an incremental update are counted."""
+        updated_path = tmp_path / "updated.pdf"
+        shutil.copyfile(sample_pdf_path, updated_path)
+        doc = fitz.open(updated_path)
+        doc.new_page(0)
+        doc.saveIncr()
+        doc.close()
+
+        assert _scan_page_count(updated_path.read_bytes()) == 11
+        assert count_pdf_pages(updated_path) == 11
+
+    def test_count_falls_back_for_xref_streams(self, sample_pdf_bytes: bytes):
+        """Test PDFs with cross-reference streams are still counted."""
+        doc = fitz.open(stream=sample_pdf_bytes, filetype="pdf")
+        compressed = doc.tobytes(use_objstms=1)
+
+        assert _scan_page_count(compressed) is None
+        assert count_pdf_pages(compressed) == 10
+
+
+class TestNamedDestinations:
+    """Tests for named destinations created with pypdf."""
+
+    def test_destinations_sorted_and_resolved(self, sample_pdf_bytes: bytes):
+        """Test that the /Dests name tree is sorted and points at each page."""
+        merger = PdfMerger()
+        result = merger.prepend_pages(sample_pdf_bytes, sample_pdf_bytes)
+
+        reader = PdfReader(io.BytesIO(result))
+        names = reader.trailer["/Root"]["/Names"]["/Dests"]["/Names"][::2]
+        assert names == sorted(f"page_{i}" for i in range(1, 21))
+        destinations = reader.named_destinations
+        assert reader.get_destination_page_number(destinations["page_12"]) == 11
+
+
+class TestWriteTo:
+    """Tests for writing merged PDFs."""
+
+    def test_write_to_path_stream_and_bytes(
+        self, sample_pdf_bytes: bytes, tmp_path: Path
+    ):
+        """Test that the merged PDF can be written again to any output."""
+        merger = PdfMerger()
+        result = merger.prepend_pages(sample_pdf_bytes, sample_pdf_bytes)
+
+        output_path = tmp_path / "merged.pdf"
+        stream = io.BytesIO()
+        assert merger.write_to(output_path) is None
+        assert merger.write_to(stream) is None
+        assert merger.write_to() == result
+        assert output_path.read_bytes() == stream.getvalue() == result
+
+
+class TestLinkAnnotations:
+    """Tests for link annotations added with pypdf."""
+
+    def test_links_added_per_page(self, sample_pdf_bytes: bytes):
+        """Test that links land on their pages and skip invalid targets."""
+        link_positions = [
+            LinkPosition(0, 12, "Page 2", 100, 400, 50, 20),
+            LinkPosition(1, 15, "Page 5", 100, 400, 50, 20),
+            LinkPosition(0, 14, "Page 4", 100, 300, 50, 20),
+            LinkPosition(0, 99, "Missing", 100, 200, 50, 20),
+            LinkPosition(99, 3, "No page", 100, 200, 50, 20),
+            LinkPosition(-1, 3, "Before start", 100, 200, 50, 20),
+            LinkPosition(1, 0, "No target", 100, 200, 50, 20),
+        ]
+        merger = PdfMerger()
+        result = merger.merge_with_destinations_and_links(
+            sample_pdf_bytes, sample_pdf_bytes, link_positions
+        )
+
+        with fitz.open(stream=result, filetype="pdf") as doc:
+            assert [link["page"] for link in doc[0].get_links()] == [11, 13]
+            assert [link["page"] for link in doc[1].get_links()] == [14]
+            assert not doc[19].get_links()
+            assert doc[0].get_links()[0]["from"] == fitz.Rect(100, 372, 150, 392)
+
+
+class TestPyMuPDFBackend:
+    """Tests for merging with the PyMuPDF backend."""
+
+    def test_prepend_pages(self, sample_pdf_bytes: bytes):
+        """Test prepending pages and creating destinations with PyMuPDF."""
+        merger = PdfMerger(backend="pymupdf")
+        result = merger.prepend_pages(sample_pdf_bytes, sample_pdf_bytes)
+
+        reader = PdfReader(io.BytesIO(result))
+        assert len(reader.pages) == 20
+        destination = reader.named_destinations["page_20"]
+        assert destination["/Type"] == "/FitH"
+        assert destination["/Top"] == 792
+
+    def test_prepend_pages_without_destinations(self, sample_pdf_bytes: bytes):
+        """Test that destinations can be skipped with PyMuPDF."""
+        merger = PdfMerger(backend="pymupdf")
+        result = merger.prepend_pages(
+            sample_pdf_bytes, sample_pdf_bytes, create_destinations=False
+        )
+
+        reader = PdfReader(io.BytesIO(result))
+        assert len(reader.pages) == 20
+        assert not reader.named_destinations
+
+    def test_prepend_pages_with_reader(self, sample_pdf_bytes: bytes):
+        """Test that open readers fall back to merging with pypdf."""
+        merger = PdfMerger(backend="pymupdf")
+        original = open_pdf_reader(sample_pdf_bytes)
+        result = merger.prepend_pages(sample_pdf_bytes, original)
+
+        reader = PdfReader(io.BytesIO(result))
+        assert len(reader.pages) == 20
+        assert "page_20" in reader.named_destinations
+
+    def test_write_to_after_pymupdf_merge(self, sample_pdf_bytes: bytes):
+        """Test that write_to refuses to emit the unused pypdf writer."""
+        merger = PdfMerger(backend="pymupdf")
+        merger.prepend_pages(sample_pdf_bytes, sample_pdf_bytes)
+        with pytest.raises(RuntimeError):
+            merger.write_to()
+
+    def test_links_match_pypdf_without_text_match(self, sample_pdf_bytes: bytes):
+        """Test that links whose text is not on the page land where pypdf puts them."""
+        link_positions = [
+            LinkPosition(0, 12, "Not on the page", 100, 400, 50, 20),
+            LinkPosition(1, 15, "", 200, 300, 60, 12),
+        ]
+
+        def links(backend: str) -> list[tuple[int, int, fitz.Rect]]:
+            result = PdfMerger(backend=backend).merge_with_destinations_and_links(
+                sample_pdf_bytes, sample_pdf_bytes, link_positions
+            )
+            with fitz.open(stream=result, filetype="pdf") as doc:
+                return [
+                    (page.number, link["page"], link["from"])
+                    for page in doc
+                    for link in page.get_links()
+                ]
+
+        assert links("pymupdf") == links("pypdf")
+        assert len(links("pypdf")) == 2
+
+    def test_unknown_backend(self):
+        """Test that unsupported backends are rejected."""
+        with pytest.raises(ValueError):
+            PdfMerger(backend="pdfium")
+
+
+class TestOpenPdfReader:
+    """Tests for open_pdf_reader."""
+
+    def test_reader_sees_rewritten_file(
+        self, sample_pdf_path: Path, sample_pdf_bytes: bytes
+    ):
+        """Test that each call maps the file as it is on disk."""
+        reader = open_pdf_reader(sample_pdf_path)
+        assert open_pdf_reader(reader) is reader
+        assert len(reader.pages) == 10
+        del reader
+
+        with fitz.open(stream=sample_pdf_bytes, filetype="pdf") as doc:
+            doc.new_page()
+            sample_pdf_path.write_bytes(doc.tobytes())
+        assert len(open_pdf_reader(str(sample_pdf_path)).pages) == 11
+
+    def test_memoryview_sources(self, sample_pdf_bytes: bytes):
+        """Test reading PDFs from whole and partial memoryviews."""
+        view = memoryview(sample_pdf_bytes)
+        assert _unwrap_buffer(view) is sample_pdf_bytes
+        assert len(open_pdf_reader(view).pages) == 10
+
+        padded = memoryview(b"  " + sample_pdf_bytes)[2:]
+        assert _unwrap_buffer(padded) is padded
+        assert len(open_pdf_reader(padded).pages) == 10
+        assert count_pdf_pages(padded) == 10
@@ -33,6 +33,12 @@ class TestTextFormatter:
         assert formatter.escape_xml("Hello World") == "Hello World"
         assert formatter.escape_xml("Test 123") == "Test 123"
 
+    def test_escape_xml_returns_clean_text_unchanged(self):
+        """Test that text without special characters is returned as is."""
+        formatter = TextFormatter()
+        text = "".join(["Plain ", "text"])
+        assert formatter.escape_xml(text) is text
+
     def test_format_bold_text(self):
         """Test bold marker conversion."""
         formatter = TextFormatter()
@@ -63,6 +69,13 @@ class TestTextFormatter:
         assert result.count("<b>") == 2
         assert result.count("</b>") == 2
 
+    def test_format_many_sections_alternate_tags(self):
+        """Test that tags open and close in turn across many sections."""
+        formatter = TextFormatter()
+        text = " ".join(f"**b{i}** _i{i}_" for i in range(200))
+        result = formatter.format_text(text)
+        assert result == " ".join(f"<b>b{i}</b> <i>i{i}</i>" for i in range(200))
+
     def test_format_with_xml_escaping(self):
         """Test formatting with XML characters that need escaping."""
         formatter = TextFormatter()
@@ -70,6 +83,17 @@ class TestTextFormatter:
         assert "<b>" in result
         assert "&amp;" in result
 
+    def test_format_bold_inside_italic_escaped_once(self):
+        """Test that text in nested sections is escaped only once."""
+        formatter = TextFormatter()
+        result = formatter.format_text("_see **A & B**_ now")
+        assert result == "<i>see <b>A &amp; B</b></i> now"
+
+    def test_format_unpaired_markers_kept(self):
+        """Test that markers without a partner are left as text."""
+        formatter = TextFormatter()
+        assert formatter.format_text("snake_case & **x") == "snake_case &amp; **x"
+
     def test_format_no_bold(self):
         """Test disabling bold formatting."""
         formatter = TextFormatter()
@@ -128,6 +152,13 @@ class TestTextFormatter:
         result = formatter.create_link("Click & go", "page_1")
         assert "&amp;" in result
 
+    def test_create_link_reused_across_formatters(self):
+        """Test that repeated links return the same markup object."""
+        first = TextFormatter().create_link("See Chapter 2", "page_3")
+        second = TextFormatter().create_link("See Chapter 2", "page_3")
+        assert first is second
+        assert TextFormatter().create_link("See Chapter 2", "page_3", False) != first
+
     def test_format_empty_string(self):
         """Test formatting empty string."""
         formatter = TextFormatter()
@@ -140,6 +171,29 @@ class TestTextFormatter:
         result = formatter.format_text("Plain text without markers")
         assert result == "Plain text without markers"
 
+    def test_format_no_markers_escapes(self):
+        """Test that text without markers is still escaped."""
+        formatter = TextFormatter()
+        assert formatter.format_text("a < b & c") == "a &lt; b &amp; c"
+        assert formatter.format_text("a < b", escape_first=False) == "a < b"
+
+    def test_patterns_shared_between_formatters(self):
+        """Test that formatters with the same markers share compiled patterns."""
+        first = TextFormatter()
+        second = TextFormatter()
+        assert first._bold_pattern is second._bold_pattern
+        assert first._italic_pattern is second._italic_pattern
+        assert TextFormatter(bold_marker="__")._bold_pattern is not first._bold_pattern
+
+    def test_format_text_memoized_until_markers_change(self):
+        """Test that formatted text is reused until a marker is reassigned."""
+        formatter = TextFormatter()
+        first = formatter.format_text("**Note:** __x__")
+        assert formatter.format_text("**Note:** __x__") is first
+
+        formatter.bold_marker = "__"
+        assert formatter.format_text("**Note:** __x__") == "**Note:** <b>x</b>"
+
     def test_custom_bold_marker(self):
         """Test with custom bold marker."""
         formatter = TextFormatter(bold_marker="__")